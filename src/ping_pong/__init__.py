@@ -9,6 +9,12 @@ __version__ = "1.0.0"
 __author__ = "Ping-Pong Development Team"
 __email__ = "dev@pingpong.game"
 
-from .__main__ import main
+__all__ = ["main"]
 
-__all__ = ["main"] 
\ No newline at end of file
+
+def __getattr__(name):
+    """Import the entry point lazily so importing the package stays cheap."""
+    if name == "main":
+        from .__main__ import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -5,40 +5,102 @@ This module can be run directly to start the game:
     python -m ping_pong
 """
 
+import re
 import sys
-import argparse
 from pathlib import Path
+from types import SimpleNamespace
 
-from .core.game import Game
+
+USAGE = "usage: python -m ping_pong [-h] [--config CONFIG] [--debug] [--windowed] [--fps FPS]"
+
+HELP = f"""{USAGE}
+
+Ping-Pong Game
+
+options:
+  -h, --help       show this help message and exit
+  --config CONFIG  Path to configuration file (default: config.json)
+  --debug          Enable debug mode
+  --windowed       Force windowed mode (disable fullscreen)
+  --fps FPS        Target FPS (default: 60)"""
+
+# Arguments argparse accepts as option values even though they start with '-'
+_NEGATIVE_NUMBER = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+# Flag name -> (attribute, converter); flags with no converter take no value
+_OPTIONS = {
+    "--config": ("config", str),
+    "--fps": ("fps", int),
+    "--debug": ("debug", None),
+    "--windowed": ("windowed", None),
+}
+
+
+def _usage_error(message: str) -> None:
+    """Print a usage error and exit with argparse's status code."""
+    print(f"{USAGE}\nping_pong: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def parse_args(argv=None) -> SimpleNamespace:
+    """
+    Parse command line arguments.
+
+    The CLI only has four options, so they are parsed by hand rather than
+    paying for the argparse import on every launch.
+
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Namespace with config, debug, windowed and fps attributes
+    """
+    args = SimpleNamespace(config="config.json", debug=False, windowed=False, fps=60)
+    argv = sys.argv[1:] if argv is None else argv
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if arg in ("-h", "--help"):
+            print(HELP)
+            sys.exit(0)
+
+        flag, has_inline_value, inline_value = arg.partition("=")
+        option = _OPTIONS.get(flag)
+        if option is None:
+            _usage_error(f"unrecognized arguments: {arg}")
+
+        attribute, converter = option
+        if converter is None:
+            if has_inline_value:
+                _usage_error(f"argument {flag}: ignored explicit argument '{inline_value}'")
+            setattr(args, attribute, True)
+            continue
+
+        if has_inline_value:
+            value = inline_value
+        elif i < len(argv) and (not argv[i].startswith("-") or _NEGATIVE_NUMBER.match(argv[i])):
+            value = argv[i]
+            i += 1
+        else:
+            _usage_error(f"argument {flag}: expected one argument")
+
+        try:
+            setattr(args, attribute, converter(value))
+        except ValueError:
+            _usage_error(f"argument {flag}: invalid {converter.__name__} value: '{value}'")
+
+    return args
 
 
 def main():
     """Main entry point for the ping-pong game."""
-    parser = argparse.ArgumentParser(description="Ping-Pong Game")
-    parser.add_argument(
-        "--config", 
-        type=str, 
-        default="config.json",
-        help="Path to configuration file (default: config.json)"
-    )
-    parser.add_argument(
-        "--debug",
-        action="store_true",
-        help="Enable debug mode"
-    )
-    parser.add_argument(
-        "--windowed",
-        action="store_true", 
-        help="Force windowed mode (disable fullscreen)"
-    )
-    parser.add_argument(
-        "--fps",
-        type=int,
-        default=60,
-        help="Target FPS (default: 60)"
-    )
+    args = parse_args()
     
-    args = parser.parse_args()
+    # Imported after argument parsing so --help and usage errors skip pygame
+    from .core.game import Game
     
     try:
         # Create game instance
@@ -5,16 +5,25 @@ This module contains all the component types used in the game,
 including position, velocity, rendering, collision, and input components.
 """
 
-from .position import PositionComponent
-from .velocity import VelocityComponent
-from .render import RenderComponent
-from .collision import CollisionComponent
-from .input import InputComponent
+from importlib import import_module
 
-__all__ = [
-    "PositionComponent",
-    "VelocityComponent", 
-    "RenderComponent",
-    "CollisionComponent",
-    "InputComponent"
-] 
\ No newline at end of file
+# Exported component name -> submodule defining it
+_COMPONENT_MODULES = {
+    "PositionComponent": ".position",
+    "VelocityComponent": ".velocity",
+    "RenderComponent": ".render",
+    "CollisionComponent": ".collision",
+    "InputComponent": ".input",
+}
+
+__all__ = list(_COMPONENT_MODULES)
+
+
+def __getattr__(name):
+    """Import components on first access so unused ones are never loaded."""
+    module_name = _COMPONENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -2,25 +2,34 @@
 Collision component for collision detection and response.
 """
 
-from dataclasses import dataclass
-from dataclasses_json import dataclass_json
-from typing import Set
-from enum import Enum
-import pygame
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional
+from enum import IntFlag
 
 from ..core.ecs.component import Component
 
+# pygame is imported lazily so the component can be used headlessly
+if TYPE_CHECKING:
+    import pygame
 
-class CollisionType(Enum):
-    """Types of collision objects."""
-    PADDLE = "paddle"
-    BALL = "ball"
-    WALL = "wall"
-    GOAL = "goal"
+# Shared rectangle reused by fill_rect(), created on first use
+_scratch_rect: Optional["pygame.Rect"] = None
 
 
-@dataclass_json
-@dataclass
+class CollisionType(IntFlag):
+    """Types of collision objects (one bit each, combinable into masks)."""
+    PADDLE = 1
+    BALL = 2
+    WALL = 4
+    GOAL = 8
+
+
+# Mask that collides with every collision type
+ALL_COLLISION_TYPES = int(CollisionType.PADDLE | CollisionType.BALL |
+                          CollisionType.WALL | CollisionType.GOAL)
+
+
+@dataclass(slots=True)
 class CollisionComponent(Component):
     """
     Component that handles collision detection and response.
@@ -31,67 +40,133 @@ class CollisionComponent(Component):
         collision_type: Type of collision object
         solid: Whether this object blocks movement
         trigger: Whether this is a trigger (detects but doesn't block)
-        collision_mask: Set of collision types this object can collide with
+        collision_mask: Bitmask of collision types this object can collide with
         bounce_factor: How much velocity is retained after collision (0-1)
+    
+    Half extents and the type and mask bits are cached in the store for
+    the collision queries; assigning width, height, collision_type or
+    collision_mask updates the cached values as well.
     """
+    SOA_FIELDS: ClassVar[Dict[str, str]] = {
+        "width": "col_width",
+        "height": "col_height",
+        "bounce_factor": "col_bounce",
+        "_hw": "col_half_w",
+        "_hh": "col_half_h",
+        "_type_bits": "col_type",
+        "_mask_bits": "col_mask",
+    }
+    
     width: float = 10.0
     height: float = 10.0
     collision_type: CollisionType = CollisionType.PADDLE
     solid: bool = True
     trigger: bool = False
     bounce_factor: float = 1.0
+    collision_mask: int = ALL_COLLISION_TYPES
     
-    # Collision mask - which types this object can collide with
-    # This is handled as a list for JSON serialization
-    collision_mask: list = None
+    # Cached half extents (kept in sync by __setattr__)
+    _hw: float = field(default=5.0, init=False, repr=False, compare=False)
+    _hh: float = field(default=5.0, init=False, repr=False, compare=False)
+    
+    # Cached collision_type and collision_mask as floats, for the store
+    # arrays (kept in sync by __setattr__)
+    _type_bits: float = field(default=0.0, init=False, repr=False, compare=False)
+    _mask_bits: float = field(default=0.0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Initialize collision mask if not provided."""
-        if self.collision_mask is None:
-            self.collision_mask = [ct.value for ct in CollisionType]
+        """Compute the cached half extents and type and mask bits."""
+        self._hw = self.width * 0.5
+        self._hh = self.height * 0.5
+        self._type_bits = float(self.collision_type)
+        self._mask_bits = float(self.collision_mask)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, keeping the cached extents and bits in sync."""
+        object.__setattr__(self, name, value)
+        if name == 'width':
+            object.__setattr__(self, '_hw', value * 0.5)
+        elif name == 'height':
+            object.__setattr__(self, '_hh', value * 0.5)
+        elif name == 'collision_type':
+            object.__setattr__(self, '_type_bits', float(value))
+        elif name == 'collision_mask':
+            object.__setattr__(self, '_mask_bits', float(value))
     
     def reset(self) -> None:
         """Reset to default collision state."""
-        self.width = 10.0
-        self.height = 10.0
-        self.collision_type = CollisionType.PADDLE
+        self.set_size(10.0, 10.0)
+        self.set_collision_type(CollisionType.PADDLE)
         self.solid = True
         self.trigger = False
         self.bounce_factor = 1.0
-        self.collision_mask = [ct.value for ct in CollisionType]
+        self.set_collision_mask(ALL_COLLISION_TYPES)
     
     def set_size(self, width: float, height: float) -> None:
         """Set the collision box size."""
         self.width = width
         self.height = height
     
+    def set_collision_type(self, collision_type: CollisionType) -> None:
+        """Set the collision type."""
+        self.collision_type = collision_type
+    
+    def set_collision_mask(self, collision_mask: int) -> None:
+        """Set the mask of collision types this object collides with."""
+        self.collision_mask = collision_mask
+    
     def can_collide_with(self, other_type: CollisionType) -> bool:
         """Check if this object can collide with another type."""
-        return other_type.value in self.collision_mask
+        return bool(self.collision_mask & other_type)
     
     def add_collision_type(self, collision_type: CollisionType) -> None:
         """Add a collision type to the mask."""
-        if collision_type.value not in self.collision_mask:
-            self.collision_mask.append(collision_type.value)
+        self.set_collision_mask(self.collision_mask | collision_type)
     
     def remove_collision_type(self, collision_type: CollisionType) -> None:
         """Remove a collision type from the mask."""
-        if collision_type.value in self.collision_mask:
-            self.collision_mask.remove(collision_type.value)
+        self.set_collision_mask(self.collision_mask & ~collision_type)
     
-    def get_collision_rect(self, x: float, y: float) -> pygame.Rect:
+    def get_collision_rect(self, x: float, y: float) -> "pygame.Rect":
         """Get the collision rectangle at the given position."""
+        import pygame
+        
         return pygame.Rect(
-            int(x - self.width / 2),
-            int(y - self.height / 2),
+            int(x - self._hw),
+            int(y - self._hh),
             int(self.width),
             int(self.height)
         )
     
+    def fill_rect(self, x: float, y: float, rect: Optional["pygame.Rect"] = None) -> "pygame.Rect":
+        """
+        Write the collision rectangle at the given position into a rect.
+        
+        Args:
+            x: X position of the entity
+            y: Y position of the entity
+            rect: Rectangle to update in place (defaults to a shared
+                scratch rect that is only valid until the next call)
+            
+        Returns:
+            The updated rectangle
+        """
+        if rect is None:
+            global _scratch_rect
+            if _scratch_rect is None:
+                import pygame
+                _scratch_rect = pygame.Rect(0, 0, 0, 0)
+            rect = _scratch_rect
+        rect.x = int(x - self._hw)
+        rect.y = int(y - self._hh)
+        rect.width = int(self.width)
+        rect.height = int(self.height)
+        return rect
+    
     def get_collision_bounds(self, x: float, y: float) -> tuple:
         """Get collision bounds as (left, top, right, bottom)."""
-        half_width = self.width / 2
-        half_height = self.height / 2
+        half_width = self._hw
+        half_height = self._hh
         return (
             x - half_width,  # left
             y - half_height,  # top
@@ -100,6 +175,6 @@ class CollisionComponent(Component):
         )
     
     def __str__(self) -> str:
-        return (f"Collision(type: {self.collision_type.value}, "
+        return (f"Collision(type: {self.collision_type.name.lower()}, "
                 f"size: {self.width}x{self.height}, "
                 f"solid: {self.solid}, bounce: {self.bounce_factor})") 
\ No newline at end of file
@@ -3,21 +3,32 @@ Input component for handling user input.
 """
 
 from dataclasses import dataclass, field
-from dataclasses_json import dataclass_json
-from typing import Dict, Set
-import pygame
+from typing import AbstractSet, Dict, FrozenSet, Mapping, Set, Tuple
 
 from ..core.ecs.component import Component
 
+# Incremented whenever any InputComponent's key bindings change
+_bindings_version = 0
 
-@dataclass_json
-@dataclass
+
+def get_bindings_version() -> int:
+    """
+    Get a counter that changes whenever any key binding changes.
+    
+    Lets systems cache the set of bound keys and rebuild it only when
+    bindings are added, removed or cleared.
+    """
+    return _bindings_version
+
+
+@dataclass(slots=True)
 class InputComponent(Component):
     """
     Component that handles input mapping and state for an entity.
     
     Attributes:
         key_bindings: Dictionary mapping action names to pygame key codes
+            (modify through bind_key/unbind_key so lookups stay in sync)
         enabled: Whether input is currently enabled
         move_speed: Speed multiplier for movement actions
     """
@@ -29,22 +40,59 @@ class InputComponent(Component):
     current_actions: Set[str] = field(default_factory=set, init=False)
     previous_actions: Set[str] = field(default_factory=set, init=False)
     
+    # Reverse lookup of key_bindings: key code -> actions bound to it
+    _reverse_bindings: Dict[int, Tuple[str, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    
+    # Movement direction derived from current_actions in update_input_state
+    _mv_x: float = field(default=0.0, init=False, repr=False)
+    _mv_y: float = field(default=0.0, init=False, repr=False)
+    
+    # Bit layout set by assign_key_bits() for update_input_mask():
+    # (action, key bit) pairs and the left/right/up/down key bits
+    _action_bits: Tuple[Tuple[str, int], ...] = field(default=(), init=False, repr=False)
+    _move_bits: Tuple[int, int, int, int] = field(default=(0, 0, 0, 0), init=False, repr=False)
+    
+    def __post_init__(self):
+        """Build the reverse key lookup for the initial bindings."""
+        self._rebuild_reverse_bindings()
+    
     def reset(self) -> None:
         """Reset to default input state."""
         self.key_bindings.clear()
+        self._rebuild_reverse_bindings()
         self.enabled = True
         self.move_speed = 300.0
         self.current_actions.clear()
         self.previous_actions.clear()
+        self._mv_x = 0.0
+        self._mv_y = 0.0
     
     def bind_key(self, action: str, key_code: int) -> None:
         """Bind an action to a key code."""
         self.key_bindings[action] = key_code
+        self._rebuild_reverse_bindings()
     
     def unbind_key(self, action: str) -> None:
         """Remove a key binding."""
         if action in self.key_bindings:
             del self.key_bindings[action]
+            self._rebuild_reverse_bindings()
+    
+    def _rebuild_reverse_bindings(self) -> None:
+        """Rebuild the key code -> actions lookup from key_bindings."""
+        global _bindings_version
+        _bindings_version += 1
+        
+        reverse: Dict[int, Tuple[str, ...]] = {}
+        for action, key_code in self.key_bindings.items():
+            reverse[key_code] = reverse.get(key_code, ()) + (action,)
+        self._reverse_bindings = reverse
+    
+    def get_bound_keys(self) -> FrozenSet[int]:
+        """Get the key codes bound to any action."""
+        return frozenset(self._reverse_bindings)
     
     def get_key_for_action(self, action: str) -> int:
         """Get the key code for an action."""
@@ -64,40 +112,101 @@ class InputComponent(Component):
         return (action not in self.current_actions and 
                 action in self.previous_actions)
     
-    def update_input_state(self, pressed_keys: Set[int]) -> None:
-        """Update the input state based on currently pressed keys."""
+    def update_input_state(self, pressed_keys: AbstractSet[int]) -> None:
+        """
+        Update the input state based on currently pressed keys.
+        
+        Call this once per frame; calling it twice in a frame makes
+        previous_actions equal current_actions and loses
+        just-pressed/just-released transitions. InputSystem uses the
+        equivalent update_input_mask() with a bitmask of the bound keys.
+        
+        Args:
+            pressed_keys: Set of currently pressed key codes
+        """
         if not self.enabled:
             self.current_actions.clear()
+            self._mv_x = 0.0
+            self._mv_y = 0.0
             return
         
-        # Store previous state
-        self.previous_actions = self.current_actions.copy()
+        # Store previous state by swapping the two sets (no allocation)
+        self.previous_actions, self.current_actions = self.current_actions, self.previous_actions
         self.current_actions.clear()
         
-        # Check which actions are currently active
-        for action, key_code in self.key_bindings.items():
-            if key_code in pressed_keys:
-                self.current_actions.add(action)
+        # Look up the actions bound to each pressed key
+        reverse_bindings = self._reverse_bindings
+        for key_code in pressed_keys:
+            actions = reverse_bindings.get(key_code)
+            if actions:
+                self.current_actions.update(actions)
+        
+        # Opposing actions cancel out (bools subtract as 0/1)
+        current_actions = self.current_actions
+        self._mv_x = float(("move_right" in current_actions) - ("move_left" in current_actions))
+        self._mv_y = float(("move_down" in current_actions) - ("move_up" in current_actions))
+    
+    def assign_key_bits(self, key_bits: Mapping[int, int]) -> None:
+        """
+        Map this component's bindings onto a pressed-key bitmask layout.
+        
+        Must be called again whenever the bindings or the layout change.
+        
+        Args:
+            key_bits: Key code -> single-bit mask, covering every bound key
+        """
+        self._action_bits = tuple(
+            (action, key_bits[key_code]) for action, key_code in self.key_bindings.items()
+        )
+        action_bits = dict(self._action_bits)
+        self._move_bits = (
+            action_bits.get("move_left", 0),
+            action_bits.get("move_right", 0),
+            action_bits.get("move_up", 0),
+            action_bits.get("move_down", 0),
+        )
+    
+    def update_input_mask(self, pressed_mask: int) -> None:
+        """
+        Update the input state from a bitmask of pressed keys.
+        
+        Same as update_input_state(), but each key test is an integer AND
+        against the layout given to assign_key_bits().
+        
+        Args:
+            pressed_mask: Bits of the currently pressed keys
+        """
+        if not self.enabled:
+            self.current_actions.clear()
+            self._mv_x = 0.0
+            self._mv_y = 0.0
+            return
+        
+        # Store previous state by swapping the two sets (no allocation)
+        self.previous_actions, self.current_actions = self.current_actions, self.previous_actions
+        current_actions = self.current_actions
+        current_actions.clear()
+        
+        if pressed_mask:
+            for action, bit in self._action_bits:
+                if pressed_mask & bit:
+                    current_actions.add(action)
+        
+        # Opposing keys cancel out (bools subtract as 0/1)
+        left, right, up, down = self._move_bits
+        self._mv_x = float(bool(pressed_mask & right) - bool(pressed_mask & left))
+        self._mv_y = float(bool(pressed_mask & down) - bool(pressed_mask & up))
     
     def get_movement_vector(self) -> tuple:
         """
         Get the movement vector based on current input.
         
+        The direction is computed once per frame in update_input_state().
+        
         Returns:
             Tuple of (dx, dy) representing movement direction
         """
-        dx, dy = 0.0, 0.0
-        
-        if self.is_action_active("move_up"):
-            dy -= 1.0
-        if self.is_action_active("move_down"):
-            dy += 1.0
-        if self.is_action_active("move_left"):
-            dx -= 1.0
-        if self.is_action_active("move_right"):
-            dx += 1.0
-        
-        return dx, dy
+        return self._mv_x, self._mv_y
     
     def get_movement_velocity(self) -> tuple:
         """
@@ -106,8 +215,8 @@ class InputComponent(Component):
         Returns:
             Tuple of (vx, vy) in pixels per second
         """
-        dx, dy = self.get_movement_vector()
-        return dx * self.move_speed, dy * self.move_speed
+        move_speed = self.move_speed
+        return self._mv_x * move_speed, self._mv_y * move_speed
     
     def setup_default_bindings(self, player_number: int = 1) -> None:
         """
@@ -116,6 +225,9 @@ class InputComponent(Component):
         Args:
             player_number: Player number (1 or 2) for different key sets
         """
+        # Imported here so the component can be used without pygame loaded
+        import pygame
+        
         if player_number == 1:
             # Player 1: WASD keys
             self.bind_key("move_up", pygame.K_w)
@@ -3,13 +3,12 @@ Position component for entity positioning.
 """
 
 from dataclasses import dataclass
-from dataclasses_json import dataclass_json
+from typing import ClassVar, Dict
 
 from ..core.ecs.component import Component
 
 
-@dataclass_json
-@dataclass
+@dataclass(slots=True)
 class PositionComponent(Component):
     """
     Component that stores the position of an entity in 2D space.
@@ -18,6 +17,8 @@ class PositionComponent(Component):
         x: X coordinate in pixels
         y: Y coordinate in pixels
     """
+    SOA_FIELDS: ClassVar[Dict[str, str]] = {"x": "pos_x", "y": "pos_y"}
+    
     x: float = 0.0
     y: float = 0.0
     
@@ -32,7 +33,12 @@ class PositionComponent(Component):
         self.y = y
     
     def translate(self, dx: float, dy: float) -> None:
-        """Move the position by the given offset."""
+        """
+        Move the position by the given offset.
+        
+        Single-entity path for editor/debug use; MovementSystem integrates
+        all positions at once on the ComponentStore arrays.
+        """
         self.x += dx
         self.y += dy
     
@@ -42,5 +48,11 @@ class PositionComponent(Component):
         dy = self.y - other.y
         return (dx * dx + dy * dy) ** 0.5
     
+    def distance_sq_to(self, other: 'PositionComponent') -> float:
+        """Calculate squared distance to another position (for comparisons)."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+    
     def __str__(self) -> str:
         return f"Position({self.x:.1f}, {self.y:.1f})" 
\ No newline at end of file
@@ -3,15 +3,29 @@ Render component for entity rendering.
 """
 
 from dataclasses import dataclass, field
-from dataclasses_json import dataclass_json
-from typing import Optional, Tuple
-import pygame
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from ..core.ecs.component import Component
 
+# pygame is imported lazily so the component can be used headlessly
+if TYPE_CHECKING:
+    import pygame
 
-@dataclass_json
-@dataclass
+# Incremented whenever any RenderComponent's layer changes
+_layers_version = 0
+
+
+def get_layers_version() -> int:
+    """
+    Get a counter that changes whenever any render layer changes.
+    
+    Lets systems keep entities sorted by layer and re-sort them only when
+    a layer was changed through set_layer().
+    """
+    return _layers_version
+
+
+@dataclass(slots=True)
 class RenderComponent(Component):
     """
     Component that stores rendering information for an entity.
@@ -24,6 +38,9 @@ class RenderComponent(Component):
         visible: Whether the entity should be rendered
         texture_name: Name of texture asset (if using textures)
         alpha: Transparency (0-255, 255 = opaque)
+    
+    The layer of a component that is already in use should be changed
+    through set_layer(), so the draw order is updated.
     """
     width: float = 10.0
     height: float = 10.0
@@ -34,7 +51,7 @@ class RenderComponent(Component):
     alpha: int = 255
     
     # Runtime fields (not serialized)
-    surface: Optional[pygame.Surface] = field(default=None, init=False)
+    surface: Optional["pygame.Surface"] = field(default=None, init=False)
     dirty: bool = field(default=True, init=False)
     
     def reset(self) -> None:
@@ -42,7 +59,7 @@ class RenderComponent(Component):
         self.width = 10.0
         self.height = 10.0
         self.color = (255, 255, 255)
-        self.layer = 0
+        self.set_layer(0)
         self.visible = True
         self.texture_name = None
         self.alpha = 255
@@ -51,9 +68,19 @@ class RenderComponent(Component):
     
     def set_color(self, r: int, g: int, b: int) -> None:
         """Set the color and mark as dirty."""
-        self.color = (r, g, b)
+        color = (r, g, b)
+        if color == self.color:
+            return
+        self.color = color
         self.dirty = True
     
+    def set_layer(self, layer: int) -> None:
+        """Set the rendering layer."""
+        global _layers_version
+        if layer != self.layer:
+            self.layer = layer
+            _layers_version += 1
+    
     def set_size(self, width: float, height: float) -> None:
         """Set the size and mark as dirty."""
         self.width = width
@@ -78,8 +105,10 @@ class RenderComponent(Component):
         """Show the entity."""
         self.visible = True
     
-    def get_rect(self, x: float, y: float) -> pygame.Rect:
+    def get_rect(self, x: float, y: float) -> "pygame.Rect":
         """Get the rendering rectangle at the given position."""
+        import pygame
+        
         return pygame.Rect(
             int(x - self.width / 2),
             int(y - self.height / 2),
@@ -87,8 +116,18 @@ class RenderComponent(Component):
             int(self.height)
         )
     
-    def create_surface(self) -> pygame.Surface:
-        """Create a pygame surface for this render component."""
+    def create_surface(self) -> "pygame.Surface":
+        """
+        Get the pygame surface for this render component.
+        
+        The surface is cached and only rebuilt after a change marks the
+        component as dirty.
+        """
+        if self.surface is not None and not self.dirty:
+            return self.surface
+        
+        import pygame
+        
         if self.texture_name:
             # In a full implementation, this would load from asset manager
             # For now, create a colored rectangle
@@ -99,9 +138,16 @@ class RenderComponent(Component):
             surface = pygame.Surface((int(self.width), int(self.height)))
             surface.fill(self.color)
         
+        # Match the display pixel format so blits don't convert per pixel
+        # (skipped when no display exists, e.g. in headless tools)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        
         if self.alpha < 255:
             surface.set_alpha(self.alpha)
         
+        self.surface = surface
+        self.dirty = False
         return surface
     
     def __str__(self) -> str:
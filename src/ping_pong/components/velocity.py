@@ -3,14 +3,39 @@ Velocity component for entity movement.
 """
 
 from dataclasses import dataclass
-from dataclasses_json import dataclass_json
+from typing import ClassVar, Dict
+import cmath
 import math
 
+import numpy as np
+
 from ..core.ecs.component import Component
 
 
-@dataclass_json
-@dataclass
+def clamp_to_max_speeds(dx: np.ndarray, dy: np.ndarray, max_speed: np.ndarray) -> None:
+    """
+    Clamp many velocities to their maximum speeds, in place.
+    
+    The array version of VelocityComponent._clamp_to_max_speed(): speeds
+    are compared and rescaled in float64, like the scalar code, and a
+    max_speed of 0 means no limit.
+    
+    Args:
+        dx, dy: Velocity components (float32, e.g. gathered from the store)
+        max_speed: Maximum speed of each velocity
+    """
+    max_speed = max_speed.astype(np.float64)
+    dx64 = dx.astype(np.float64)
+    dy64 = dy.astype(np.float64)
+    speed_sq = dx64 * dx64 + dy64 * dy64
+    clamp = (max_speed > 0) & (speed_sq > max_speed * max_speed)
+    if clamp.any():
+        factor = max_speed[clamp] / np.sqrt(speed_sq[clamp])
+        dx[clamp] = dx64[clamp] * factor
+        dy[clamp] = dy64[clamp] * factor
+
+
+@dataclass(slots=True)
 class VelocityComponent(Component):
     """
     Component that stores the velocity of an entity in 2D space.
@@ -20,6 +45,12 @@ class VelocityComponent(Component):
         dy: Velocity in Y direction (pixels per second)
         max_speed: Maximum allowed speed (0 = no limit)
     """
+    SOA_FIELDS: ClassVar[Dict[str, str]] = {
+        "dx": "vel_dx",
+        "dy": "vel_dy",
+        "max_speed": "vel_max_speed",
+    }
+    
     dx: float = 0.0
     dy: float = 0.0
     max_speed: float = 0.0  # 0 means no speed limit
@@ -51,14 +82,20 @@ class VelocityComponent(Component):
         """Get the current speed (magnitude of velocity)."""
         return math.sqrt(self.dx * self.dx + self.dy * self.dy)
     
+    def get_speed_sq(self) -> float:
+        """Get the squared speed (cheaper than get_speed for comparisons)."""
+        return self.dx * self.dx + self.dy * self.dy
+    
     def get_direction(self) -> float:
         """Get the direction in radians."""
         return math.atan2(self.dy, self.dx)
     
     def set_speed_and_direction(self, speed: float, direction: float) -> None:
         """Set velocity using speed and direction."""
-        self.dx = speed * math.cos(direction)
-        self.dy = speed * math.sin(direction)
+        # cmath.rect evaluates cos and sin together in one C call
+        velocity = cmath.rect(speed, direction)
+        self.dx = velocity.real
+        self.dy = velocity.imag
         self._clamp_to_max_speed()
     
     def normalize(self, target_speed: float = 1.0) -> None:
@@ -79,12 +116,15 @@ class VelocityComponent(Component):
     
     def _clamp_to_max_speed(self) -> None:
         """Clamp velocity to maximum speed if set."""
-        if self.max_speed > 0:
-            current_speed = self.get_speed()
-            if current_speed > self.max_speed:
-                factor = self.max_speed / current_speed
-                self.dx *= factor
-                self.dy *= factor
+        max_speed = self.max_speed
+        if max_speed > 0:
+            # Compare squared speeds; only take the sqrt when clamping
+            dx, dy = self.dx, self.dy
+            speed_sq = dx * dx + dy * dy
+            if speed_sq > max_speed * max_speed:
+                factor = max_speed / math.sqrt(speed_sq)
+                self.dx = dx * factor
+                self.dy = dy * factor
     
     def __str__(self) -> str:
         return f"Velocity({self.dx:.1f}, {self.dy:.1f}) [speed: {self.get_speed():.1f}]" 
\ No newline at end of file
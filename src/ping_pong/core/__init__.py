@@ -5,7 +5,14 @@ This module contains the fundamental building blocks of the game engine,
 including the ECS system, configuration management, and main game loop.
 """
 
-from .game import Game
 from .config import GameConfig
 
-__all__ = ["Game", "GameConfig"] 
\ No newline at end of file
+__all__ = ["Game", "GameConfig"]
+
+
+def __getattr__(name):
+    """Import Game lazily, since it pulls in pygame and all systems."""
+    if name == "Game":
+        from .game import Game
+        return Game
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
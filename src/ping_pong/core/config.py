@@ -5,19 +5,64 @@ Centralized configuration for all game settings including display,
 gameplay, physics, and audio parameters.
 """
 
+import copy
 import json
-from dataclasses import dataclass, asdict
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Buffer size for config file I/O, so each file is read/written in one call
+_IO_BUFFER_SIZE = 1 << 16
+
+if orjson is not None:
+    # orjson is an optional, faster drop-in for the stdlib codec
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Dict[str, Any]) -> bytes:
+        """Serialize config data to indented JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Dict[str, Any]) -> bytes:
+        """Serialize config data to indented JSON bytes."""
+        return json.dumps(data, indent=2).encode("utf-8")
+
+# Parsed configs keyed by (absolute path, mtime in ns), least recently used first
+_CONFIG_CACHE: "OrderedDict[tuple, GameConfig]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True, slots=True)
+class PhysicsConsts:
+    """
+    Immutable snapshot of the settings read by physics code every frame.
+    
+    GameConfig.snapshot() returns a cached instance that is rebuilt only
+    after a setting changes, so systems can fetch it every frame and read
+    these slot attributes instead of going back to the config per entity.
+    """
+    screen_width: int
+    screen_height: int
+    ball_speed_increase: float
+    max_ball_speed: float
+
+
+@dataclass(slots=True)
 class GameConfig:
     """
     Centralized game configuration.
     
     All game settings are stored here and can be loaded from/saved to
-    configuration files.
+    configuration files. Fields declared with init=False are internal
+    state and are never serialized.
     """
     
     # Display settings
@@ -68,11 +113,33 @@ class GameConfig:
     # Input settings
     INPUT_BUFFER_SIZE: int = 8  # Frames to buffer input
     
+    # Last validate_settings() input and result
+    _last_validate_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _last_validate_result: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Lazily built dict views of the settings, dropped on any setting write
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _summary_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Physics snapshot returned by snapshot(), dropped on any setting write
+    _physics_cache: Optional[PhysicsConsts] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the cached views of the settings."""
+        object.__setattr__(self, name, value)
+        if not name.startswith('_'):
+            object.__setattr__(self, '_dict_cache', None)
+            object.__setattr__(self, '_summary_cache', None)
+            object.__setattr__(self, '_physics_cache', None)
+    
     @classmethod
     def load_from_file(cls, config_path: str) -> 'GameConfig':
         """
         Load configuration from a JSON file.
         
+        Parsed files are cached by path and modification time, so loading
+        an unchanged file again returns a copy without re-reading it.
+        
         Args:
             config_path: Path to the configuration file
             
@@ -81,25 +148,38 @@ class GameConfig:
         """
         config_file = Path(config_path)
         
-        if not config_file.exists():
-            # Create default config file
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except OSError:
+            # Missing or unreadable: create a default config file
             default_config = cls()
             default_config.save_to_file(config_path)
             return default_config
         
+        cache_key = (os.path.abspath(config_file), mtime_ns)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and type(cached) is cls:
+            _CONFIG_CACHE.move_to_end(cache_key)
+            return copy.copy(cached)
+        
         try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
+            with open(config_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                config_data = _json_loads(f.read())
             
             # Create instance with loaded data
             config = cls()
             for key, value in config_data.items():
-                if hasattr(config, key):
+                if key in _SETTING_NAMES:
                     setattr(config, key, value)
             
+            _CONFIG_CACHE[cache_key] = copy.copy(config)
+            if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                _CONFIG_CACHE.popitem(last=False)
+            
             return config
             
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, IOError) as e:
+            # json and orjson decode errors are both ValueError subclasses
             print(f"Warning: Could not load config from {config_path}: {e}")
             print("Using default configuration.")
             return cls()
@@ -114,12 +194,49 @@ class GameConfig:
         config_file = Path(config_path)
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # Drop cached parses of the file being overwritten
+        config_file_path = os.path.abspath(config_file)
+        for cache_key in [key for key in _CONFIG_CACHE if key[0] == config_file_path]:
+            del _CONFIG_CACHE[cache_key]
+        
+        # Serialize up front so the file gets a single write
+        config_bytes = _json_dumps(self._settings_dict())
+        
         try:
-            with open(config_file, 'w') as f:
-                json.dump(asdict(self), f, indent=2)
+            with open(config_file, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+                f.write(config_bytes)
         except IOError as e:
             print(f"Warning: Could not save config to {config_path}: {e}")
     
+    def _settings_dict(self) -> Dict[str, Any]:
+        """Get the serializable settings (all init fields) as a cached dict."""
+        settings = self._dict_cache
+        if settings is None:
+            settings = {name: getattr(self, name) for name in _SETTING_NAMES}
+            self._dict_cache = settings
+        return settings
+    
+    def snapshot(self) -> PhysicsConsts:
+        """
+        Get an immutable snapshot of the per-frame physics settings.
+        
+        The snapshot is built on first use and reused until a setting
+        changes.
+        
+        Returns:
+            PhysicsConsts with the current values
+        """
+        physics = self._physics_cache
+        if physics is None:
+            physics = PhysicsConsts(
+                self.SCREEN_WIDTH,
+                self.SCREEN_HEIGHT,
+                self.BALL_SPEED_INCREASE,
+                self.MAX_BALL_SPEED,
+            )
+            self._physics_cache = physics
+        return physics
+    
     def get_screen_size(self) -> tuple:
         """Get screen dimensions as a tuple."""
         return (self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
@@ -139,9 +256,20 @@ class GameConfig:
         """
         Validate configuration settings and return any issues.
         
+        The result is cached until one of the validated settings changes.
+        
         Returns:
             List of validation error messages
         """
+        validate_key = (
+            self.SCREEN_WIDTH, self.SCREEN_HEIGHT, self.TARGET_FPS,
+            self.BALL_SPEED, self.PADDLE_SPEED, self.MAX_BALL_SPEED,
+            self.PADDLE_WIDTH, self.PADDLE_HEIGHT, self.PADDLE_OFFSET,
+            self.MASTER_VOLUME, self.SFX_VOLUME, self.MUSIC_VOLUME,
+        )
+        if validate_key == self._last_validate_key:
+            return list(self._last_validate_result)
+        
         errors = []
         
         # Screen resolution validation
@@ -166,12 +294,16 @@ class GameConfig:
         if self.PADDLE_OFFSET < 0 or self.PADDLE_OFFSET > self.SCREEN_WIDTH // 4:
             errors.append("Paddle offset should be between 0 and screen_width/4")
         
-        # Volume validation
-        volumes = [self.MASTER_VOLUME, self.SFX_VOLUME, self.MUSIC_VOLUME]
-        for vol in volumes:
-            if vol < 0.0 or vol > 1.0:
-                errors.append("Volume values must be between 0.0 and 1.0")
+        # Volume validation (one error per out-of-range volume)
+        if self.MASTER_VOLUME < 0.0 or self.MASTER_VOLUME > 1.0:
+            errors.append("Volume values must be between 0.0 and 1.0")
+        if self.SFX_VOLUME < 0.0 or self.SFX_VOLUME > 1.0:
+            errors.append("Volume values must be between 0.0 and 1.0")
+        if self.MUSIC_VOLUME < 0.0 or self.MUSIC_VOLUME > 1.0:
+            errors.append("Volume values must be between 0.0 and 1.0")
         
+        self._last_validate_key = validate_key
+        self._last_validate_result = tuple(errors)
         return errors
     
     def apply_performance_preset(self, preset: str) -> None:
@@ -203,8 +335,16 @@ class GameConfig:
             self.ENABLE_PERFORMANCE_MONITORING = True
     
     def get_config_summary(self) -> Dict[str, Any]:
-        """Get a summary of current configuration."""
-        return {
+        """
+        Get a summary of current configuration.
+        
+        The summary is cached until a setting changes; treat it as read-only.
+        """
+        summary = self._summary_cache
+        if summary is not None:
+            return summary
+        
+        summary = {
             "display": {
                 "resolution": f"{self.SCREEN_WIDTH}x{self.SCREEN_HEIGHT}",
                 "fps": self.TARGET_FPS,
@@ -223,4 +363,10 @@ class GameConfig:
                 "debug_mode": self.DEBUG_MODE,
                 "show_fps": self.SHOW_FPS
             }
-        } 
\ No newline at end of file
+        }
+        self._summary_cache = summary
+        return summary
+
+
+# Names of the user-facing settings, in declaration order
+_SETTING_NAMES = tuple(f.name for f in fields(GameConfig) if f.init)
\ No newline at end of file
@@ -15,6 +15,7 @@ from .component import Component
 from .system import System
 from .entity_manager import EntityManager
 from .component_manager import ComponentManager
+from .component_store import ComponentStore
 from .system_manager import SystemManager
 
 __all__ = [
@@ -24,5 +25,6 @@ __all__ = [
     "System",
     "EntityManager",
     "ComponentManager",
+    "ComponentStore",
     "SystemManager"
 ] 
\ No newline at end of file
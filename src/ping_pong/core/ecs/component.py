@@ -6,12 +6,11 @@ They should not contain any behavior or logic.
 """
 
 from abc import ABC
-from dataclasses import dataclass
-from dataclasses_json import dataclass_json
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, Optional, Type
 
 
-@dataclass_json
-@dataclass
+@dataclass(slots=True)
 class Component(ABC):
     """
     Base class for all ECS components.
@@ -19,7 +18,26 @@ class Component(ABC):
     Components are pure data containers that store entity state.
     They should be immutable when possible and contain no logic.
     
-    The @dataclass_json decorator enables automatic JSON serialization
-    for save/load functionality.
+    Save/load serialization is handled by the ComponentManager, which
+    reads and writes the dataclass init fields.
+    
+    Subclasses may set SOA_FIELDS to have numeric fields stored in the
+    ComponentStore arrays (field name -> array name) instead of on the
+    instance.
+    """
+    SOA_FIELDS: ClassVar[Dict[str, str]] = {}
+    
+    # Pool state: None if not pooled, True while free, False while acquired
+    _pool_free: Optional[bool] = field(default=None, init=False, repr=False, compare=False) 
+
+
+def component_type_of(component: Component) -> Type[Component]:
+    """
+    Get the type a component is stored and looked up under.
+    
+    Components held by the EntityManager may be ComponentStore views,
+    which are generated subclasses of the component type; they map back
+    to it through their _base_type attribute.
     """
-    pass 
\ No newline at end of file
+    component_type = type(component)
+    return getattr(component_type, "_base_type", component_type)
\ No newline at end of file
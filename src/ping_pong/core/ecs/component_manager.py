@@ -5,11 +5,52 @@ Provides additional functionality for component management,
 including component pools and serialization.
 """
 
-from typing import Dict, Type, List, Any, Optional
+from dataclasses import fields
+from enum import Enum
+from operator import attrgetter
+from typing import Callable, Dict, Type, List, Any, Optional, Tuple, get_origin
 from collections import defaultdict
 
 from . import EntityID
-from .component import Component
+from .component import Component, component_type_of
+from .component_store import ComponentStore
+
+# (field name, getter) pairs used to serialize one component type
+FieldGetters = Tuple[Tuple[str, Callable[[Component], Any]], ...]
+
+# Field name -> converter from the JSON value, for fields that need one
+FieldDecoders = Dict[str, Callable[[Any], Any]]
+
+
+def _build_field_getters(component_type: Type[Component]) -> FieldGetters:
+    """
+    Build the getters for a component type's serializable fields.
+    
+    Only init fields are serialized; init=False fields hold derived or
+    runtime state (caches, pool flags) that is rebuilt on construction.
+    """
+    return tuple(
+        (field.name, attrgetter(field.name))
+        for field in fields(component_type)
+        if field.init
+    )
+
+
+def _build_field_decoders(component_type: Type[Component]) -> FieldDecoders:
+    """
+    Build the converters for fields whose JSON form differs from their type.
+    
+    Enum fields are stored as their values and tuple fields as lists.
+    """
+    decoders = {}
+    for field in fields(component_type):
+        if not field.init:
+            continue
+        if isinstance(field.type, type) and issubclass(field.type, Enum):
+            decoders[field.name] = field.type
+        elif field.type is tuple or get_origin(field.type) is tuple:
+            decoders[field.name] = tuple
+    return decoders
 
 
 class ComponentPool:
@@ -18,37 +59,43 @@ class ComponentPool:
     def __init__(self, component_type: Type[Component], initial_size: int = 10):
         self.component_type = component_type
         self.available: List[Component] = []
-        self.in_use: set = set()
+        self.in_use_count = 0
         self._expand_pool(initial_size)
     
     def _expand_pool(self, size: int) -> None:
         """Expand the pool with new component instances."""
-        for _ in range(size):
-            # Create default instance (components must support default construction)
-            try:
-                component = self.component_type()
-                self.available.append(component)
-            except TypeError:
-                # Component doesn't support default construction
-                break
+        # Create default instances (components must support default construction)
+        component_type = self.component_type
+        try:
+            new_components = [component_type() for _ in range(size)]
+        except TypeError:
+            # Component doesn't support default construction
+            return
+        
+        for component in new_components:
+            component._pool_free = True
+        self.available.extend(new_components)
     
     def acquire(self) -> Optional[Component]:
         """Get a component instance from the pool."""
         if not self.available:
-            self._expand_pool(10)
+            # Every pooled instance is in use, so this doubles the pool
+            self._expand_pool(max(16, self.in_use_count))
         
         if self.available:
             component = self.available.pop()
-            self.in_use.add(id(component))
+            component._pool_free = False
+            self.in_use_count += 1
             return component
         
         return None
     
     def release(self, component: Component) -> None:
         """Return a component instance to the pool."""
-        component_id = id(component)
-        if component_id in self.in_use:
-            self.in_use.remove(component_id)
+        # Only components acquired from a pool (and not yet released) qualify
+        if component._pool_free is False:
+            component._pool_free = True
+            self.in_use_count -= 1
             # Reset component to default state if possible
             self._reset_component(component)
             self.available.append(component)
@@ -68,11 +115,18 @@ class ComponentManager:
     Provides additional functionality beyond the basic EntityManager,
     including component object pooling for performance and component
     serialization for save/load functionality.
+    
+    When given the EntityManager's ComponentStore, registering a component
+    type with SOA_FIELDS also allocates its float32 arrays up front, so the
+    first entity using the type does not pay for the allocation mid-game.
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[ComponentStore] = None):
         self._component_pools: Dict[Type[Component], ComponentPool] = {}
         self._component_registry: Dict[str, Type[Component]] = {}
+        self._field_getters: Dict[Type[Component], FieldGetters] = {}
+        self._field_decoders: Dict[Type[Component], FieldDecoders] = {}
+        self.store = store
     
     def register_component_type(self, component_type: Type[Component]) -> None:
         """
@@ -82,6 +136,12 @@ class ComponentManager:
             component_type: The component class to register
         """
         self._component_registry[component_type.__name__] = component_type
+        self._field_getters[component_type] = _build_field_getters(component_type)
+        self._field_decoders[component_type] = _build_field_decoders(component_type)
+        
+        # Allocate the SoA arrays for array-backed fields
+        if self.store is not None and component_type.SOA_FIELDS:
+            self.store.component_bit(component_type)
         
         # Create object pool for this component type
         if component_type not in self._component_pools:
@@ -106,6 +166,10 @@ class ComponentManager:
                 for key, value in kwargs.items():
                     if hasattr(component, key):
                         setattr(component, key, value)
+                
+                # Recompute derived state (e.g. cached half extents)
+                if kwargs and hasattr(component, '__post_init__'):
+                    component.__post_init__()
                 return component
         
         # Create new instance if pool is not available or empty
@@ -118,7 +182,7 @@ class ComponentManager:
         Args:
             component: The component to release
         """
-        component_type = type(component)
+        component_type = component_type_of(component)
         if component_type in self._component_pools:
             self._component_pools[component_type].release(component)
     
@@ -136,12 +200,15 @@ class ComponentManager:
         for component_type, component in components.items():
             component_name = component_type.__name__
             try:
-                # Use dataclass_json serialization if available
-                if hasattr(component, 'to_dict'):
-                    serialized[component_name] = component.to_dict()
-                else:
-                    # Fallback to basic dict conversion
-                    serialized[component_name] = component.__dict__.copy()
+                getters = self._field_getters.get(component_type)
+                if getters is None:
+                    getters = _build_field_getters(component_type)
+                    self._field_getters[component_type] = getters
+                
+                # Plain attribute reads, no per-call dataclass reflection
+                serialized[component_name] = {
+                    name: getter(component) for name, getter in getters
+                }
             except Exception as e:
                 print(f"Warning: Could not serialize component {component_name}: {e}")
         
@@ -163,12 +230,11 @@ class ComponentManager:
             if component_name in self._component_registry:
                 component_type = self._component_registry[component_name]
                 try:
-                    # Use dataclass_json deserialization if available
-                    if hasattr(component_type, 'from_dict'):
-                        component = component_type.from_dict(component_data)
-                    else:
-                        # Fallback to basic construction
-                        component = component_type(**component_data)
+                    decoders = self._field_decoders[component_type]
+                    component = component_type(**{
+                        name: decoders[name](value) if name in decoders else value
+                        for name, value in component_data.items()
+                    })
                     
                     components[component_type] = component
                 except Exception as e:
@@ -186,7 +252,7 @@ class ComponentManager:
         for component_type, pool in self._component_pools.items():
             stats[component_type.__name__] = {
                 "available": len(pool.available),
-                "in_use": len(pool.in_use),
-                "total": len(pool.available) + len(pool.in_use)
+                "in_use": pool.in_use_count,
+                "total": len(pool.available) + pool.in_use_count
             }
         return stats 
\ No newline at end of file
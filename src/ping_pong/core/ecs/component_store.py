@@ -0,0 +1,305 @@
+"""
+Component Store for the ECS system.
+
+Provides Struct-of-Arrays (SoA) storage for numeric component fields,
+so systems can work on contiguous arrays instead of chasing per-entity
+component objects.
+"""
+
+from dataclasses import fields
+from typing import Dict, Iterable, List, Type
+
+import numpy as np
+
+from . import EntityID
+from .component import Component, component_type_of
+
+# Initial number of entity slots (arrays grow by doubling when exceeded)
+MAX_ENTITIES = 1024
+
+# Number of distinct component types an archetype bitmask can describe
+MAX_COMPONENT_TYPES = 64
+
+
+def _array_property(array_name: str) -> property:
+    """Create a property that reads/writes one element of a store array."""
+    def fget(self):
+        return getattr(self._store, array_name)[self._entity_id].item()
+
+    def fset(self, value):
+        getattr(self._store, array_name)[self._entity_id] = value
+
+    return property(fget, fset)
+
+
+class _DetachedRow:
+    """
+    Private one-entity stand-in for a ComponentStore.
+
+    A view that no longer belongs to an entity (or was created outside the
+    store) points at one of these instead, so its SoA fields keep their own
+    values rather than aliasing a store row that gets cleared or reused.
+    """
+
+    def __init__(self, array_names: Iterable[str]):
+        for array_name in array_names:
+            setattr(self, array_name, np.zeros(1, dtype=np.float32))
+
+
+def _detach(view: Component) -> None:
+    """Move a view's SoA fields from its store row into a private row."""
+    soa_fields = view._base_type.SOA_FIELDS
+    values = {}
+    if hasattr(view, "_store"):
+        values = {field_name: getattr(view, field_name) for field_name in soa_fields}
+    view._store = _DetachedRow(soa_fields.values())
+    view._entity_id = 0
+    for field_name, value in values.items():
+        setattr(view, field_name, value)
+
+
+def _view_init(self, *args, **kwargs) -> None:
+    """Construct a view directly (e.g. via dataclasses.replace), detached."""
+    _detach(self)
+    self._base_type.__init__(self, *args, **kwargs)
+
+
+def _view_copy(self) -> Component:
+    """Copy a view into a detached view, so the copy has its own values."""
+    view_type = type(self)
+    copy = view_type.__new__(view_type)
+    _detach(copy)
+    for field in fields(self):
+        setattr(copy, field.name, getattr(self, field.name))
+    return copy
+
+
+def _view_eq(self, other: object) -> bool:
+    """Compare by field values with any instance of the same component type."""
+    base_type = self._base_type
+    if component_type_of(other) is not base_type:
+        return NotImplemented
+    soa_fields = base_type.SOA_FIELDS
+    for field in fields(base_type):
+        if not field.compare:
+            continue
+        other_value = getattr(other, field.name)
+        if field.name in soa_fields:
+            # Plain instances hold the float64 value the store would round
+            other_value = float(np.float32(other_value))
+        if getattr(self, field.name) != other_value:
+            return False
+    return True
+
+
+class ComponentStore:
+    """
+    Struct-of-Arrays storage for component data.
+
+    Component types that declare ``SOA_FIELDS`` (a mapping of field name to
+    array name) have those fields stored in parallel float32 arrays indexed
+    by entity ID, e.g. ``store.pos_x[entity_id]``. The component instance
+    held by the EntityManager becomes a thin view whose fields read and
+    write the arrays, so the regular component API keeps working.
+
+    Every entity also carries an archetype bitmask (one bit per component
+    type), which lets systems find matching entities with a single
+    vectorized mask test instead of per-entity lookups.
+    """
+
+    def __init__(self, capacity: int = MAX_ENTITIES):
+        self.capacity = capacity
+        self.size = 0  # One past the highest entity ID stored
+        self.mask = np.zeros(capacity, dtype=np.uint64)
+        self._array_names: List[str] = []
+        self._component_bits: Dict[Type[Component], int] = {}
+        self._view_types: Dict[Type[Component], type] = {}
+
+    def component_bit(self, component_type: Type[Component]) -> int:
+        """
+        Get the archetype bit for a component type, registering it if needed.
+
+        Registering a type also allocates the arrays for its SoA fields.
+
+        Args:
+            component_type: The component class
+
+        Returns:
+            The single-bit mask assigned to the component type
+        """
+        bit = self._component_bits.get(component_type)
+        if bit is not None:
+            return bit
+
+        if len(self._component_bits) >= MAX_COMPONENT_TYPES:
+            raise ValueError(
+                f"Cannot register {component_type.__name__}: "
+                f"more than {MAX_COMPONENT_TYPES} component types"
+            )
+
+        bit = 1 << len(self._component_bits)
+        self._component_bits[component_type] = bit
+
+        for array_name in component_type.SOA_FIELDS.values():
+            if array_name not in self._array_names:
+                self._array_names.append(array_name)
+                setattr(self, array_name, np.zeros(self.capacity, dtype=np.float32))
+
+        return bit
+
+    def register(self, component_types: Iterable[Type[Component]]) -> None:
+        """
+        Register component types ahead of use.
+
+        This assigns their archetype bits and allocates the arrays for their
+        SoA fields, so systems can bind those arrays before any entity has
+        the components.
+
+        Args:
+            component_types: The component classes to register
+        """
+        for component_type in component_types:
+            self.component_bit(component_type)
+
+    def get_mask(self, component_types: Iterable[Type[Component]]) -> int:
+        """Get the combined archetype mask for a set of component types."""
+        mask = 0
+        for component_type in component_types:
+            mask |= self.component_bit(component_type)
+        return mask
+
+    def query(self, required_mask: int) -> np.ndarray:
+        """
+        Get the IDs of all entities whose archetype contains the mask.
+
+        Args:
+            required_mask: Mask returned by get_mask()
+
+        Returns:
+            Array of matching entity IDs
+        """
+        required = np.uint64(required_mask)
+        return np.flatnonzero((self.mask[:self.size] & required) == required)
+
+    def add_component_bit(self, entity_id: EntityID, component_type: Type[Component]) -> None:
+        """Mark an entity as having a component type."""
+        bit = self.component_bit(component_type)
+        self._ensure_capacity(entity_id)
+        self.mask[entity_id] |= np.uint64(bit)
+
+    def remove_component_bit(self, entity_id: EntityID, component_type: Type[Component]) -> None:
+        """Mark an entity as no longer having a component type."""
+        bit = self.component_bit(component_type)
+        if entity_id < self.size:
+            self.mask[entity_id] &= ~np.uint64(bit)
+
+    def bind(self, entity_id: EntityID, component: Component) -> Component:
+        """
+        Move a component's SoA fields into the store.
+
+        Args:
+            entity_id: The entity that owns the component
+            component: The component instance to store
+
+        Returns:
+            A view of the component backed by the store arrays
+        """
+        component_type = component_type_of(component)
+        self.component_bit(component_type)
+        self._ensure_capacity(entity_id)
+
+        view_type = self._view_types.get(component_type)
+        if view_type is None:
+            view_type = self._create_view_type(component_type)
+            self._view_types[component_type] = view_type
+
+        view = view_type.__new__(view_type)
+        view._store = self
+        view._entity_id = entity_id
+        for field in fields(component):
+            setattr(view, field.name, getattr(component, field.name))
+
+        return view
+
+    def unbind(self, entity_id: EntityID, component: Component) -> None:
+        """
+        Detach a removed component's view and zero its SoA fields.
+
+        The view keeps the values it had, in a private row, so references
+        to it stay valid after the entity's row is cleared or reused.
+
+        Args:
+            entity_id: The entity the component was removed from
+            component: The view returned by bind()
+        """
+        if hasattr(component, "_store"):
+            _detach(component)
+        if entity_id >= self.size:
+            return
+
+        for array_name in component_type_of(component).SOA_FIELDS.values():
+            getattr(self, array_name)[entity_id] = 0.0
+
+    def clear_entities(self, entity_ids: Iterable[EntityID]) -> None:
+        """
+        Reset the archetype mask and all array fields of several entities.
+        
+        Args:
+            entity_ids: Entities whose stored data should be cleared
+        """
+        ids = np.fromiter(entity_ids, dtype=np.int64)
+        ids = ids[ids < self.size]
+        if not len(ids):
+            return
+        
+        self.mask[ids] = 0
+        for array_name in self._array_names:
+            getattr(self, array_name)[ids] = 0.0
+    
+    def clear(self) -> None:
+        """Reset all stored data."""
+        self.mask.fill(0)
+        for array_name in self._array_names:
+            getattr(self, array_name).fill(0.0)
+        self.size = 0
+
+    def _ensure_capacity(self, entity_id: EntityID) -> None:
+        """Grow the arrays so entity_id is a valid index."""
+        if entity_id >= self.capacity:
+            self._grow_all(max(self.capacity * 2, entity_id + 1))
+
+        if entity_id >= self.size:
+            self.size = entity_id + 1
+
+    def _grow_all(self, new_capacity: int) -> None:
+        """Grow the mask and every field array to a new capacity."""
+        self.mask = self._grow(self.mask, new_capacity)
+        for array_name in self._array_names:
+            setattr(self, array_name, self._grow(getattr(self, array_name), new_capacity))
+        self.capacity = new_capacity
+
+    @staticmethod
+    def _grow(array: np.ndarray, new_capacity: int) -> np.ndarray:
+        """Copy an array into a larger zero-filled array."""
+        grown = np.zeros(new_capacity, dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+
+    @staticmethod
+    def _create_view_type(component_type: Type[Component]) -> type:
+        """Create a subclass of component_type whose SoA fields are array-backed."""
+        namespace = {
+            "__slots__": ("_store", "_entity_id"),
+            "__module__": component_type.__module__,
+            "__qualname__": component_type.__qualname__,
+            "_base_type": component_type,
+            "__init__": _view_init,
+            "__copy__": _view_copy,
+            "__eq__": _view_eq,
+            "__hash__": None,
+        }
+        for field_name, array_name in component_type.SOA_FIELDS.items():
+            namespace[field_name] = _array_property(array_name)
+
+        metaclass = type(component_type)
+        return metaclass(component_type.__name__, (component_type,), namespace)
@@ -4,11 +4,17 @@ Entity Manager for the ECS system.
 Manages entity lifecycle, component assignment, and entity queries.
 """
 
-from typing import Dict, List, Set, Type, Optional, Iterator
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple, Type, Optional, Iterator
 from collections import defaultdict
 
+import numpy as np
+
 from . import EntityID, ComponentType
-from .component import Component
+from .component import Component, component_type_of
+from .component_store import ComponentStore
+
+# Stand-in slot list for component types that were never added
+_EMPTY: tuple = ()
 
 
 class EntityManager:
@@ -20,24 +26,151 @@ class EntityManager:
     - Adding and removing components from entities
     - Querying entities by component types
     - Managing entity-component relationships
+    
+    Numeric fields of components that declare SOA_FIELDS live in
+    ``self.store`` (a ComponentStore), which systems can use for
+    array-based updates.
+    
+    Components are stored per type, in a list indexed by entity ID (the
+    same slot layout ComponentStore uses for its arrays), so a lookup is a
+    single list index rather than two nested dict lookups.
+    
+    Component combinations registered with register_archetype() keep a
+    ready-made entity list that is updated as components are added and
+    removed, so querying them needs no set math.
+    
+    ``structure_version`` changes whenever an entity is destroyed or a
+    component is added or removed, so systems can cache lists of
+    component references and rebuild them only when it moves.
     """
     
     def __init__(self):
         self._next_entity_id: int = 1
+        self._free_slots: List[int] = []  # IDs of destroyed entities, reused first
         self._entities: Set[EntityID] = set()
-        self._components: Dict[EntityID, Dict[Type[Component], Component]] = defaultdict(dict)
+        self._storage: Dict[Type[Component], List[Optional[Component]]] = {}
         self._component_to_entities: Dict[Type[Component], Set[EntityID]] = defaultdict(set)
         self._entities_to_destroy: Set[EntityID] = set()
+        self.store = ComponentStore()
+        self.structure_version = 0
+        
+        # Registered archetypes: matching entities, each entity's list index
+        # and the archetype's ComponentStore bitmask
+        self._archetype_entities: Dict[FrozenSet[Type[Component]], List[EntityID]] = {}
+        self._archetype_index: Dict[FrozenSet[Type[Component]], Dict[EntityID, int]] = {}
+        self._archetype_masks: Dict[FrozenSet[Type[Component]], np.uint64] = {}
+        self._component_archetypes: Dict[Type[Component], List[FrozenSet[Type[Component]]]] = defaultdict(list)
+        
+        # Archetypes whose list was returned by a query since it last
+        # changed; those lists are copied before the next change
+        self._lent_archetypes: Set[FrozenSet[Type[Component]]] = set()
+        
+        # Component views by component type tuple, with the structure
+        # version they were built at
+        self._archetype_views: Dict[Tuple[Type[Component], ...], Tuple[int, List[tuple]]] = {}
+    
+    def register_archetype(self, component_types: Iterable[Type[Component]]) -> None:
+        """
+        Keep an up-to-date entity list for a combination of component types.
+        
+        Args:
+            component_types: Component types that make up the archetype
+        """
+        archetype = frozenset(component_types)
+        if not archetype or archetype in self._archetype_entities:
+            return
+        
+        # One vectorized test of the store's archetype bitmasks finds the
+        # entities that already match
+        mask = np.uint64(self.store.get_mask(archetype))
+        entities = self.store.query(mask).tolist()
+        if self._entities_to_destroy:
+            entities = [entity_id for entity_id in entities
+                        if entity_id not in self._entities_to_destroy]
+        self._archetype_masks[archetype] = mask
+        self._archetype_entities[archetype] = entities
+        self._archetype_index[archetype] = {
+            entity_id: index for index, entity_id in enumerate(entities)
+        }
+        for component_type in archetype:
+            self._component_archetypes[component_type].append(archetype)
+    
+    def unregister_archetype(self, component_types: Iterable[Type[Component]]) -> None:
+        """
+        Stop maintaining the entity list for a combination of component types.
+        
+        Args:
+            component_types: Component types that make up the archetype
+        """
+        archetype = frozenset(component_types)
+        if archetype not in self._archetype_entities:
+            return
+        
+        del self._archetype_entities[archetype]
+        del self._archetype_index[archetype]
+        del self._archetype_masks[archetype]
+        self._lent_archetypes.discard(archetype)
+        for component_type in archetype:
+            self._component_archetypes[component_type].remove(archetype)
+    
+    def _archetype_add(self, entity_id: EntityID, archetype: FrozenSet[Type[Component]]) -> None:
+        """Append an entity to an archetype list if it now matches."""
+        index = self._archetype_index[archetype]
+        if entity_id in index:
+            return
+        
+        # Single bitmask test instead of a lookup per component type
+        mask = self._archetype_masks[archetype]
+        if (self.store.mask[entity_id] & mask) != mask:
+            return
+        
+        entities = self._writable_archetype(archetype)
+        index[entity_id] = len(entities)
+        entities.append(entity_id)
+    
+    def _archetype_discard(self, entity_id: EntityID, archetype: FrozenSet[Type[Component]]) -> None:
+        """Swap-remove an entity from an archetype list."""
+        index = self._archetype_index[archetype]
+        position = index.pop(entity_id, None)
+        if position is None:
+            return
+        
+        entities = self._writable_archetype(archetype)
+        last_entity = entities.pop()
+        if last_entity != entity_id:
+            entities[position] = last_entity
+            index[last_entity] = position
+    
+    def _writable_archetype(self, archetype: FrozenSet[Type[Component]]) -> List[EntityID]:
+        """
+        Get an archetype list to modify.
+        
+        A list handed out by get_entities_with_components() may still be
+        iterated by a system (which may be the one destroying entities), so
+        it is left as is and replaced by a copy.
+        """
+        entities = self._archetype_entities[archetype]
+        if archetype in self._lent_archetypes:
+            self._lent_archetypes.discard(archetype)
+            entities = self._archetype_entities[archetype] = entities.copy()
+        return entities
     
     def create_entity(self) -> EntityID:
         """
         Create a new entity.
         
+        IDs of destroyed entities are reused, which keeps the per-type slot
+        lists and ComponentStore arrays (both indexed by ID) compact.
+        
         Returns:
             The ID of the newly created entity
         """
-        entity_id = EntityID(self._next_entity_id)
-        self._next_entity_id += 1
+        # EntityID is only a static type; skip the NewType call at runtime
+        if self._free_slots:
+            entity_id = self._free_slots.pop()
+        else:
+            entity_id = self._next_entity_id
+            self._next_entity_id += 1
         self._entities.add(entity_id)
         return entity_id
     
@@ -45,14 +178,21 @@ class EntityManager:
         """
         Mark an entity for destruction.
         
-        The entity will be destroyed at the end of the current frame
-        to avoid issues with systems currently processing it.
+        The entity is dropped from archetype queries immediately, but its
+        components are only removed at the next cleanup_destroyed_entities()
+        call (the SystemManager runs one after each stage of systems), so
+        systems currently processing it are not affected.
         
         Args:
             entity_id: The entity to destroy
         """
         if entity_id in self._entities:
             self._entities_to_destroy.add(entity_id)
+            self.structure_version += 1
+            
+            # Stop returning the entity from archetype queries right away
+            for archetype in self._archetype_index:
+                self._archetype_discard(entity_id, archetype)
     
     def add_component(self, entity_id: EntityID, component: Component) -> None:
         """
@@ -65,9 +205,24 @@ class EntityManager:
         if entity_id not in self._entities:
             raise ValueError(f"Entity {entity_id} does not exist")
         
-        component_type = type(component)
-        self._components[entity_id][component_type] = component
+        component_type = component_type_of(component)
+        if component_type.SOA_FIELDS:
+            component = self.store.bind(entity_id, component)
+        
+        storage = self._storage.get(component_type)
+        if storage is None:
+            storage = self._storage[component_type] = []
+        if entity_id >= len(storage):
+            # Grow by doubling so slot allocation stays amortized O(1)
+            storage.extend([None] * (max(entity_id + 1, len(storage) * 2) - len(storage)))
+        storage[entity_id] = component
         self._component_to_entities[component_type].add(entity_id)
+        self.structure_version += 1
+        self.store.add_component_bit(entity_id, component_type)
+        
+        if entity_id not in self._entities_to_destroy:
+            for archetype in self._component_archetypes.get(component_type, ()):
+                self._archetype_add(entity_id, archetype)
     
     def remove_component(self, entity_id: EntityID, component_type: Type[Component]) -> None:
         """
@@ -80,9 +235,18 @@ class EntityManager:
         if entity_id not in self._entities:
             return
         
-        if component_type in self._components[entity_id]:
-            del self._components[entity_id][component_type]
+        if self.has_component(entity_id, component_type):
+            storage = self._storage[component_type]
+            component = storage[entity_id]
+            storage[entity_id] = None
             self._component_to_entities[component_type].discard(entity_id)
+            self.structure_version += 1
+            self.store.remove_component_bit(entity_id, component_type)
+            if component_type.SOA_FIELDS:
+                self.store.unbind(entity_id, component)
+            
+            for archetype in self._component_archetypes.get(component_type, ()):
+                self._archetype_discard(entity_id, archetype)
     
     def get_component(self, entity_id: EntityID, component_type: Type[ComponentType]) -> Optional[ComponentType]:
         """
@@ -95,10 +259,10 @@ class EntityManager:
         Returns:
             The component instance or None if not found
         """
-        if entity_id not in self._entities:
-            return None
-        
-        return self._components[entity_id].get(component_type)
+        storage = self._storage.get(component_type, _EMPTY)
+        if entity_id < len(storage):
+            return storage[entity_id]
+        return None
     
     def has_component(self, entity_id: EntityID, component_type: Type[Component]) -> bool:
         """
@@ -111,17 +275,85 @@ class EntityManager:
         Returns:
             True if the entity has the component, False otherwise
         """
-        if entity_id not in self._entities:
-            return False
+        storage = self._storage.get(component_type, _EMPTY)
+        return entity_id < len(storage) and storage[entity_id] is not None
+    
+    def get_component_storage(self, component_type: Type[ComponentType]) -> List[Optional[ComponentType]]:
+        """
+        Get the slot list holding every component of a type.
+        
+        The list is indexed by entity ID, with None for entities that do
+        not have the component. Callers must not modify it.
+        
+        Args:
+            component_type: The type of component to retrieve
+            
+        Returns:
+            The component slot list (empty if the type was never added)
+        """
+        return self._storage.get(component_type, [])
+    
+    def get_component_view(self, entities: Iterable[EntityID],
+                           component_types: Sequence[Type[Component]]) -> List[tuple]:
+        """
+        Get each entity's components of the given types as a tuple.
+        
+        The references stay valid until structure_version changes, so
+        callers can keep the result across frames.
+        
+        Args:
+            entities: Entities to include
+            component_types: Component types to fetch, in tuple order
+            
+        Returns:
+            List of (entity_id, component, ...) tuples; a component the
+            entity does not have is None
+        """
+        slot_lists = [self._storage.get(component_type, _EMPTY) for component_type in component_types]
+        view = []
+        for entity_id in entities:
+            components = [
+                slots[entity_id] if entity_id < len(slots) else None
+                for slots in slot_lists
+            ]
+            view.append((entity_id, *components))
+        return view
+    
+    def get_archetype_view(self, component_types: Sequence[Type[Component]]) -> List[tuple]:
+        """
+        Get the components of every entity that has all the given types.
+        
+        The view is cached and shared by all callers; it is only rebuilt
+        after structure_version changes. Callers may reorder it (e.g. sort
+        it) but must not otherwise modify it.
+        
+        Args:
+            component_types: Component types to fetch, in tuple order
+            
+        Returns:
+            List of (entity_id, component, ...) tuples
+        """
+        key = tuple(component_types)
+        cached = self._archetype_views.get(key)
+        if cached is not None and cached[0] == self.structure_version:
+            return cached[1]
         
-        return component_type in self._components[entity_id]
+        entities = self.get_entities_with_components(frozenset(key))
+        view = self.get_component_view(entities, key)
+        self._archetype_views[key] = (self.structure_version, view)
+        return view
     
-    def get_entities_with_components(self, component_types: List[Type[Component]]) -> List[EntityID]:
+    def get_entities_with_components(self, component_types: Iterable[Type[Component]]) -> List[EntityID]:
         """
         Get all entities that have all of the specified components.
         
+        For a registered archetype this returns the maintained list itself,
+        which callers must not modify. The returned list never changes
+        afterwards (entity and component changes go to a fresh copy), so a
+        caller can destroy entities while iterating it.
+        
         Args:
-            component_types: List of component types that entities must have
+            component_types: Component types that entities must have
             
         Returns:
             List of entity IDs that have all specified components
@@ -129,16 +361,62 @@ class EntityManager:
         if not component_types:
             return list(self._entities)
         
-        # Start with entities that have the first component type
-        result_entities = self._component_to_entities[component_types[0]].copy()
+        if self._archetype_entities:
+            if type(component_types) is not frozenset:
+                component_types = frozenset(component_types)
+            entities = self._archetype_entities.get(component_types)
+            if entities is not None:
+                self._lent_archetypes.add(component_types)
+                return entities
         
-        # Intersect with entities that have each additional component type
-        for component_type in component_types[1:]:
-            result_entities &= self._component_to_entities[component_type]
+        # Intersect starting from the smallest set; set.intersection runs
+        # in C and only ever iterates the smaller operand
+        component_to_entities = self._component_to_entities
+        entity_sets = [component_to_entities[component_type] for component_type in component_types]
+        entity_sets.sort(key=len)
+        result_entities = entity_sets[0].intersection(*entity_sets[1:])
         
         # Filter out entities marked for destruction
-        return [entity_id for entity_id in result_entities 
-                if entity_id not in self._entities_to_destroy]
+        if self._entities_to_destroy:
+            result_entities -= self._entities_to_destroy
+        return list(result_entities)
+    
+    def iter_entities_with_components(self, component_types: Iterable[Type[Component]]) -> Iterator[EntityID]:
+        """
+        Iterate over entities that have all of the specified components.
+        
+        Unlike get_entities_with_components() no intermediate set or list
+        is built, so a caller that stops early skips the remaining
+        entities. Entities must not be created, destroyed or changed while
+        the iterator is in use.
+        
+        Args:
+            component_types: Component types that entities must have
+            
+        Returns:
+            Iterator over the matching entity IDs
+        """
+        component_types = frozenset(component_types)
+        entities = self._archetype_entities.get(component_types)
+        if entities is not None:
+            return iter(entities)
+        
+        destroyed = self._entities_to_destroy
+        if not component_types:
+            return (entity_id for entity_id in self._entities if entity_id not in destroyed)
+        
+        # Walk the smallest owner set and test membership in the others
+        component_to_entities = self._component_to_entities
+        entity_sets = sorted(
+            (component_to_entities[component_type] for component_type in component_types),
+            key=len
+        )
+        smallest, others = entity_sets[0], entity_sets[1:]
+        return (
+            entity_id for entity_id in smallest
+            if entity_id not in destroyed
+            and all(entity_id in entity_set for entity_set in others)
+        )
     
     def get_all_entities(self) -> List[EntityID]:
         """
@@ -147,26 +425,42 @@ class EntityManager:
         Returns:
             List of all entity IDs (excluding those marked for destruction)
         """
-        return [entity_id for entity_id in self._entities 
-                if entity_id not in self._entities_to_destroy]
+        if not self._entities_to_destroy:
+            return list(self._entities)
+        return list(self._entities - self._entities_to_destroy)
     
     def cleanup_destroyed_entities(self) -> None:
         """
         Remove all entities marked for destruction.
         
-        This should be called at the end of each frame.
+        This should be called between stages of systems and at the end of
+        each frame.
         """
-        for entity_id in self._entities_to_destroy:
-            # Remove all components from the entity
-            if entity_id in self._components:
-                for component_type in list(self._components[entity_id].keys()):
-                    self.remove_component(entity_id, component_type)
-                del self._components[entity_id]
-            
-            # Remove from entities set
-            self._entities.discard(entity_id)
+        destroyed = self._entities_to_destroy
+        if not destroyed:
+            return
         
-        self._entities_to_destroy.clear()
+        # Remove components type by type with bulk set operations. Archetype
+        # lists already dropped these entities in destroy_entity().
+        component_to_entities = self._component_to_entities
+        store = self.store
+        for component_type, storage in self._storage.items():
+            owners = component_to_entities[component_type]
+            removed = owners & destroyed
+            if removed:
+                owners -= removed
+                soa = bool(component_type.SOA_FIELDS)
+                for entity_id in removed:
+                    if soa:
+                        # Keep outside references off the row being reused
+                        store.unbind(entity_id, storage[entity_id])
+                    storage[entity_id] = None
+        
+        store.clear_entities(destroyed)
+        self._entities -= destroyed
+        self._free_slots.extend(destroyed)
+        destroyed.clear()
+        self.structure_version += 1
     
     def get_entity_count(self) -> int:
         """Get the number of active entities."""
@@ -178,8 +472,20 @@ class EntityManager:
     
     def clear_all(self) -> None:
         """Remove all entities and components."""
+        for component_type, storage in self._storage.items():
+            if component_type.SOA_FIELDS:
+                for entity_id in self._component_to_entities[component_type]:
+                    self.store.unbind(entity_id, storage[entity_id])
         self._entities.clear()
-        self._components.clear()
+        self._storage.clear()
         self._component_to_entities.clear()
         self._entities_to_destroy.clear()
-        self._next_entity_id = 1 
\ No newline at end of file
+        self.store.clear()
+        for archetype in self._archetype_entities:
+            self._archetype_entities[archetype] = []
+        for index in self._archetype_index.values():
+            index.clear()
+        self._lent_archetypes.clear()
+        self._free_slots.clear()
+        self._next_entity_id = 1
+        self.structure_version += 1 
\ No newline at end of file
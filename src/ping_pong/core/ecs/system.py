@@ -6,10 +6,12 @@ They process entities that have specific component combinations.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Set, Type, Dict
+from typing import Callable, ClassVar, FrozenSet, List, Optional, Type, Dict
 from collections import defaultdict, deque
 import time
 
+import numpy as np
+
 from . import EntityID, ComponentType
 from .component import Component
 
@@ -18,26 +20,51 @@ class PerformanceStats:
     """Performance statistics tracking for systems."""
     
     def __init__(self, max_samples: int = 60):
-        self.update_times: deque = deque(maxlen=max_samples)
-        self.entity_counts: deque = deque(maxlen=max_samples)
+        # Sample deques are allocated on the first record_update(), so
+        # systems that are never profiled do not carry them
+        self.update_times: Optional[deque] = None
+        self.entity_counts: Optional[deque] = None
         self.max_samples = max_samples
+        
+        # Running sums over the samples currently in the deques
+        self._time_sum = 0.0
+        self._count_sum = 0
     
     def record_update(self, update_time: float, entity_count: int) -> None:
         """Record performance data for an update cycle."""
+        if self.update_times is None:
+            self.update_times = deque(maxlen=self.max_samples)
+            self.entity_counts = deque(maxlen=self.max_samples)
+        
+        # Subtract the samples the bounded deques are about to evict
+        elif len(self.update_times) == self.max_samples:
+            self._time_sum -= self.update_times[0]
+            self._count_sum -= self.entity_counts[0]
+        
         self.update_times.append(update_time)
         self.entity_counts.append(entity_count)
+        self._time_sum += update_time
+        self._count_sum += entity_count
+    
+    def reset(self) -> None:
+        """Discard all recorded samples, keeping this object in place."""
+        if self.update_times is not None:
+            self.update_times.clear()
+            self.entity_counts.clear()
+        self._time_sum = 0.0
+        self._count_sum = 0
     
     def get_average_update_time(self) -> float:
         """Get average update time in milliseconds."""
         if not self.update_times:
             return 0.0
-        return sum(self.update_times) / len(self.update_times) * 1000
+        return self._time_sum / len(self.update_times) * 1000
     
     def get_average_entity_count(self) -> float:
         """Get average number of entities processed."""
         if not self.entity_counts:
             return 0.0
-        return sum(self.entity_counts) / len(self.entity_counts)
+        return self._count_sum / len(self.entity_counts)
 
 
 class System(ABC):
@@ -47,12 +74,33 @@ class System(ABC):
     Systems contain the logic that operates on entities with specific
     component combinations. They are responsible for updating game state
     and implementing game behaviors.
+    
+    A system whose per-frame work is pure array math can set ``kernel`` to
+    a compiled module-level function (wrapped in staticmethod) and return
+    its array arguments from kernel_args(). The kernel is then called as
+    ``kernel(*kernel_args(), dt)`` in place of update(), so the frame never
+    enters the interpreter for that system.
     """
     
+    # Component types an entity needs to be processed by this system
+    REQUIRED_COMPONENTS: ClassVar[FrozenSet[Type[Component]]] = frozenset()
+    
+    # Component types the system reads and writes (None = the required set)
+    READS: ClassVar[Optional[FrozenSet[Type[Component]]]] = None
+    WRITES: ClassVar[Optional[FrozenSet[Type[Component]]]] = None
+    
+    # Optional compiled replacement for update()
+    kernel: ClassVar[Optional[Callable[..., None]]] = None
+    
+    # Whether update_with_profiling() records timings (shared by all systems)
+    _profile: ClassVar[bool] = False
+    
     def __init__(self):
         self.performance_stats = PerformanceStats()
         self.enabled = True
         self.priority = 0  # Lower values = higher priority
+        
+        self._resolve_components()
     
     @abstractmethod
     def update(self, dt: float, entities: List[EntityID]) -> None:
@@ -65,30 +113,87 @@ class System(ABC):
         """
         pass
     
-    @abstractmethod
-    def get_required_components(self) -> Set[Type[Component]]:
+    def get_required_components(self) -> FrozenSet[Type[Component]]:
         """
         Get the component types required by this system.
         
+        Subclasses declare these in REQUIRED_COMPONENTS rather than
+        overriding this method.
+        
         Returns:
             Set of component types that entities must have to be processed
         """
-        pass
+        return self.REQUIRED_COMPONENTS
+    
+    def _resolve_components(self) -> None:
+        """Freeze the required components and the read/write sets."""
+        # Frozen once so it can be used directly as the archetype key
+        self._required = frozenset(self.get_required_components())
+        
+        # Used by the SystemManager to group systems into stages
+        self.reads = self._required if self.READS is None else self.READS
+        self.writes = self._required if self.WRITES is None else self.WRITES
+    
+    def kernel_args(self) -> tuple:
+        """
+        Get the arguments passed to ``kernel`` ahead of dt.
+        
+        Returns:
+            Tuple of arrays (and scalars) the kernel operates on
+        """
+        return ()
+    
+    def warm_up(self) -> None:
+        """
+        Compile ``kernel`` ahead of the first frame.
+        
+        The kernel is run once on empty slices of its array arguments, which
+        triggers JIT compilation (or loads it from Numba's cache) without
+        touching any entity data.
+        """
+        if self.kernel is None:
+            return
+        
+        args = tuple(
+            arg[:0] if isinstance(arg, np.ndarray) else arg
+            for arg in self.kernel_args()
+        )
+        self.kernel(*args, 0.0)
+    
+    @classmethod
+    def set_profiling(cls, enabled: bool) -> None:
+        """Turn timing of system updates on or off for all systems."""
+        System._profile = enabled
+    
+    def run(self, dt: float, entities: List[EntityID]) -> None:
+        """Update the system through its kernel or update(), without timing."""
+        if self.kernel is not None:
+            self.kernel(*self.kernel_args(), dt)
+        else:
+            self.update(dt, entities)
     
     def update_with_profiling(self, dt: float, entities: List[EntityID]) -> None:
-        """Update the system with performance profiling."""
+        """Update the system, recording its timing if profiling is enabled."""
         if not self.enabled:
             return
-            
-        start_time = time.perf_counter()
-        self.update(dt, entities)
-        end_time = time.perf_counter()
+        
+        if not self._profile:
+            self.run(dt, entities)
+            return
+        
+        start_time = time.perf_counter_ns()
+        self.run(dt, entities)
+        elapsed_ns = time.perf_counter_ns() - start_time
         
         self.performance_stats.record_update(
-            end_time - start_time,
+            elapsed_ns * 1e-9,
             len(entities)
         )
     
+    def reset_stats(self) -> None:
+        """Clear this system's performance statistics."""
+        self.performance_stats.reset()
+    
     def get_performance_info(self) -> Dict[str, float]:
         """Get performance information for this system."""
         return {
@@ -4,7 +4,8 @@ System Manager for the ECS system.
 Manages system registration, execution order, and performance monitoring.
 """
 
-from typing import List, Dict, Set, Type
+from typing import List, Dict, Optional, Set, Type
+import bisect
 import time
 
 from . import EntityID
@@ -12,6 +13,9 @@ from .system import System
 from .entity_manager import EntityManager
 from .component import Component
 
+# Entity list passed to systems that require no components (never mutated)
+_NO_ENTITIES: tuple = ()
+
 
 class SystemManager:
     """
@@ -27,9 +31,14 @@ class SystemManager:
     def __init__(self, entity_manager: EntityManager):
         self.entity_manager = entity_manager
         self.systems: List[System] = []
+        self._priorities: List[int] = []  # Parallel to self.systems
         self.system_lookup: Dict[Type[System], System] = {}
+        self.enabled_count = 0  # Kept in step by enable_system/disable_system
+        self.stages: List[List[System]] = []
+        self._deps_cache: Optional[List[str]] = None  # Reset when systems change
         self.total_update_time = 0.0
         self.frame_count = 0
+        self.profile_sample_idx = 0  # Advances each profiled frame
     
     def register_system(self, system: System) -> None:
         """
@@ -38,10 +47,21 @@ class SystemManager:
         Args:
             system: The system instance to register
         """
-        if type(system) not in self.system_lookup:
-            self.systems.append(system)
-            self.system_lookup[type(system)] = system
-            self._sort_systems_by_priority()
+        system_type = type(system)
+        if system_type not in self.system_lookup:
+            # Resolved once for the reports and diagnostics
+            system._type_name = system_type.__name__
+            
+            self.system_lookup[system_type] = system
+            self._insert_by_priority(system)
+            if system.enabled:
+                self.enabled_count += 1
+            
+            # Have the entity manager maintain this system's entity list
+            self.entity_manager.register_archetype(system._required)
+            
+            # Compile any JIT kernel now rather than during the first frame
+            system.warm_up()
     
     def unregister_system(self, system_type: Type[System]) -> None:
         """
@@ -52,8 +72,44 @@ class SystemManager:
         """
         if system_type in self.system_lookup:
             system = self.system_lookup[system_type]
-            self.systems.remove(system)
+            self._remove_from_order(system)
             del self.system_lookup[system_type]
+            if system.enabled:
+                self.enabled_count -= 1
+            self._build_stages()
+            
+            # Drop the archetype list unless another system still queries it
+            if all(other._required != system._required for other in self.systems):
+                self.entity_manager.unregister_archetype(system._required)
+    
+    def invalidate_required_components(self, system_type: Type[System]) -> None:
+        """
+        Pick up a change to a system's required components.
+        
+        The required set (and the read/write sets when they default to it)
+        is frozen when the system is created; call this after changing what
+        get_required_components() returns at runtime.
+        
+        Args:
+            system_type: The type of system whose requirements changed
+        """
+        system = self.system_lookup.get(system_type)
+        if system:
+            previous = system._required
+            system._resolve_components()
+            self.entity_manager.register_archetype(system._required)
+            self._build_stages()
+            if all(other._required != previous for other in self.systems):
+                self.entity_manager.unregister_archetype(previous)
+    
+    def set_profiling(self, enabled: bool) -> None:
+        """
+        Enable or disable per-system update timing.
+        
+        Args:
+            enabled: Whether systems should record their update times
+        """
+        System.set_profiling(enabled)
     
     def get_system(self, system_type: Type[System]) -> System:
         """
@@ -67,9 +123,54 @@ class SystemManager:
         """
         return self.system_lookup.get(system_type)
     
-    def _sort_systems_by_priority(self) -> None:
-        """Sort systems by their priority (lower values = higher priority)."""
-        self.systems.sort(key=lambda s: s.priority)
+    def _insert_by_priority(self, system: System) -> None:
+        """
+        Insert a system into the execution order (lower values = higher priority).
+        
+        Systems with equal priority run in the order they were inserted.
+        """
+        index = bisect.bisect_right(self._priorities, system.priority)
+        self._priorities.insert(index, system.priority)
+        self.systems.insert(index, system)
+        self._build_stages()
+    
+    def _remove_from_order(self, system: System) -> None:
+        """Remove a system from the execution order."""
+        for index, other in enumerate(self.systems):
+            if other is system:
+                del self.systems[index]
+                del self._priorities[index]
+                break
+    
+    def _build_stages(self) -> None:
+        """
+        Group consecutive systems whose component access does not conflict.
+        
+        Systems are taken in priority order; a system joins the current
+        stage unless it writes a component another member reads or writes,
+        or reads a component another member writes. Systems in one stage
+        could therefore run in any order (or concurrently) with the same
+        result.
+        """
+        stages: List[List[System]] = []
+        stage_reads: Set[Type[Component]] = set()
+        stage_writes: Set[Type[Component]] = set()
+        
+        for system in self.systems:
+            conflict = (not system.writes.isdisjoint(stage_reads) or
+                        not system.writes.isdisjoint(stage_writes) or
+                        not system.reads.isdisjoint(stage_writes))
+            if not stages or conflict:
+                stages.append([])
+                stage_reads = set()
+                stage_writes = set()
+            
+            stages[-1].append(system)
+            stage_reads |= system.reads
+            stage_writes |= system.writes
+        
+        self.stages = stages
+        self._deps_cache = None
     
     def update_all_systems(self, dt: float) -> None:
         """
@@ -78,40 +179,58 @@ class SystemManager:
         Args:
             dt: Delta time since last frame in seconds
         """
-        frame_start_time = time.perf_counter()
+        perf_counter = time.perf_counter
+        frame_start_time = perf_counter()
         
-        for system in self.systems:
-            if not system.enabled:
-                continue
-            
-            # Get entities that match this system's required components
-            required_components = system.get_required_components()
-            entities = self.entity_manager.get_entities_with_components(
-                list(required_components)
-            )
+        # Bound once per frame rather than looked up for every system
+        get_entities = self.entity_manager.get_entities_with_components
+        systems = self.systems
+        
+        # When profiling, time one system per frame in round-robin order so
+        # every system is sampled without timing all of them every frame
+        sampled = None
+        if System._profile and systems:
+            sampled = systems[self.profile_sample_idx % len(systems)]
+            self.profile_sample_idx += 1
+        
+        cleanup = self.entity_manager.cleanup_destroyed_entities
+        for stage in self.stages:
+            for system in stage:
+                if not system.enabled:
+                    continue
+                
+                # Update the system with the entities matching its components
+                # (systems that need none, like ParticleSystem, skip the query)
+                entities = get_entities(system._required) if system._required else _NO_ENTITIES
+                if system is sampled:
+                    system.update_with_profiling(dt, entities)
+                else:
+                    system.run(dt, entities)
             
-            # Update the system with profiling
-            system.update_with_profiling(dt, entities)
+            # Apply entity destruction queued by this stage before the next
+            # stage runs (a no-op when nothing was destroyed)
+            cleanup()
         
-        # Clean up destroyed entities at the end of the frame
-        self.entity_manager.cleanup_destroyed_entities()
+        if not self.stages:
+            cleanup()
         
         # Update performance statistics
-        frame_end_time = time.perf_counter()
-        self.total_update_time += (frame_end_time - frame_start_time)
+        self.total_update_time += perf_counter() - frame_start_time
         self.frame_count += 1
     
     def enable_system(self, system_type: Type[System]) -> None:
         """Enable a system for execution."""
-        system = self.get_system(system_type)
-        if system:
+        system = self.system_lookup.get(system_type)
+        if system and not system.enabled:
             system.enabled = True
+            self.enabled_count += 1
     
     def disable_system(self, system_type: Type[System]) -> None:
         """Disable a system from execution."""
-        system = self.get_system(system_type)
-        if system:
+        system = self.system_lookup.get(system_type)
+        if system and system.enabled:
             system.enabled = False
+            self.enabled_count -= 1
     
     def set_system_priority(self, system_type: Type[System], priority: int) -> None:
         """
@@ -121,10 +240,11 @@ class SystemManager:
             system_type: The type of system to modify
             priority: New priority value (lower = higher priority)
         """
-        system = self.get_system(system_type)
-        if system:
+        system = self.system_lookup.get(system_type)
+        if system and system.priority != priority:
+            self._remove_from_order(system)
             system.priority = priority
-            self._sort_systems_by_priority()
+            self._insert_by_priority(system)
     
     def get_performance_report(self) -> Dict[str, any]:
         """
@@ -135,7 +255,7 @@ class SystemManager:
         """
         report = {
             "total_systems": len(self.systems),
-            "enabled_systems": len([s for s in self.systems if s.enabled]),
+            "enabled_systems": self.enabled_count,
             "average_frame_time_ms": 0.0,
             "total_frames": self.frame_count,
             "systems": {}
@@ -148,7 +268,7 @@ class SystemManager:
         
         # Get individual system performance
         for system in self.systems:
-            system_name = type(system).__name__
+            system_name = system._type_name
             report["systems"][system_name] = system.get_performance_info()
         
         return report
@@ -159,19 +279,32 @@ class SystemManager:
         self.frame_count = 0
         
         for system in self.systems:
-            system.performance_stats = system.performance_stats.__class__()
+            system.reset_stats()
     
     def get_system_execution_order(self) -> List[str]:
         """Get the current system execution order."""
-        return [type(system).__name__ for system in self.systems]
+        return [system._type_name for system in self.systems]
+    
+    def get_execution_stages(self) -> List[List[str]]:
+        """Get the systems grouped into stages with no conflicting access."""
+        return [[system._type_name for system in stage] for stage in self.stages]
     
     def validate_system_dependencies(self) -> List[str]:
         """
         Validate system dependencies and return any issues.
         
+        The result is cached until a system is registered, unregistered,
+        reprioritized or changes its required components.
+        
         Returns:
             List of warning messages about potential dependency issues
         """
+        if self._deps_cache is None:
+            self._deps_cache = self._find_dependency_warnings()
+        return list(self._deps_cache)
+    
+    def _find_dependency_warnings(self) -> List[str]:
+        """Build the warning list returned by validate_system_dependencies()."""
         warnings = []
         
         # Check for potential component conflicts
@@ -179,25 +312,28 @@ class SystemManager:
         component_readers: Dict[Type[Component], List[str]] = {}
         
         for system in self.systems:
-            system_name = type(system).__name__
-            required_components = system.get_required_components()
-            
-            for component_type in required_components:
-                # Assume all systems both read and potentially write components
-                # In a more sophisticated system, we'd have separate read/write declarations
-                if component_type not in component_writers:
-                    component_writers[component_type] = []
-                    component_readers[component_type] = []
-                
-                component_writers[component_type].append(system_name)
-                component_readers[component_type].append(system_name)
+            system_name = system._type_name
+            for component_type in system.writes:
+                component_writers.setdefault(component_type, []).append(system_name)
+            for component_type in system.reads - system.writes:
+                component_readers.setdefault(component_type, []).append(system_name)
         
-        # Check for potential race conditions (multiple writers)
         for component_type, writers in component_writers.items():
+            # Check for potential race conditions (multiple writers)
             if len(writers) > 1:
                 warnings.append(
                     f"Component {component_type.__name__} is modified by multiple systems: "
                     f"{', '.join(writers)}. Consider execution order."
                 )
+            
+            # Readers see the value from before or after the write
+            # depending on priority
+            readers = component_readers.get(component_type)
+            if readers:
+                warnings.append(
+                    f"Component {component_type.__name__} is modified by "
+                    f"{', '.join(writers)} and read by {', '.join(readers)}. "
+                    f"Consider execution order."
+                )
         
         return warnings 
\ No newline at end of file
@@ -15,6 +15,7 @@ from ..systems.movement import MovementSystem
 from ..systems.collision import CollisionSystem
 from ..systems.input import InputSystem
 from ..systems.render import RenderSystem
+from ..systems.particle import ParticleSystem
 from ..entities.entity_factory import EntityFactory
 
 
@@ -63,8 +64,9 @@ class Game:
         
         # Initialize ECS components
         self.entity_manager = EntityManager()
-        self.component_manager = ComponentManager()
+        self.component_manager = ComponentManager(self.entity_manager.store)
         self.system_manager = SystemManager(self.entity_manager)
+        self.system_manager.set_profiling(self.config.ENABLE_PERFORMANCE_MONITORING)
         
         # Initialize entity factory
         self.entity_factory = EntityFactory(self.entity_manager, self.config)
@@ -75,16 +77,26 @@ class Game:
         # Game state
         self.running = False
         self.paused = False
+        self._needs_flip = True  # Present the whole screen on the next render
+        
+        # Handlers for the game's own key bindings
+        self._key_handlers = {
+            pygame.K_ESCAPE: self._quit,
+            pygame.K_p: self._toggle_pause,
+            pygame.K_r: self._reset_game,
+            pygame.K_F1: self._toggle_debug_mode,
+        }
         
         # Performance tracking
         self.frame_count = 0
-        self.last_fps_update = time.time()
+        self.last_fps_update = time.perf_counter()
         self.fps_display = 60.0
         
         # Game entities
         self.player1_paddle = None
         self.player2_paddle = None
         self.ball = None
+        self._ball_pos = None  # Ball Position component, fetched once per ball
         
         # Score tracking
         self.player1_score = 0
@@ -95,17 +107,22 @@ class Game:
         # Create systems in priority order
         input_system = InputSystem(self.entity_manager)
         movement_system = MovementSystem(self.entity_manager)
-        collision_system = CollisionSystem(self.entity_manager, self.config)
-        render_system = RenderSystem(self.entity_manager, self.config, self.screen)
+        particle_system = ParticleSystem()
+        collision_system = CollisionSystem(self.entity_manager, self.config,
+                                           particle_system)
+        render_system = RenderSystem(self.entity_manager, self.config, self.screen,
+                                     particle_system)
         
         # Register systems
         self.system_manager.register_system(input_system)
         self.system_manager.register_system(movement_system)
         self.system_manager.register_system(collision_system)
+        self.system_manager.register_system(particle_system)
         self.system_manager.register_system(render_system)
         
         # Store references for easy access
         self.input_system = input_system
+        self.particle_system = particle_system
         self.render_system = render_system
     
     def initialize_game_entities(self) -> None:
@@ -123,7 +140,13 @@ class Game:
         
         # Create ball at center
         center_x, center_y = self.config.get_screen_center()
-        self.ball = self.entity_factory.create_ball(center_x, center_y)
+        self._create_ball(center_x, center_y)
+    
+    def _create_ball(self, x: float, y: float) -> None:
+        """Create the ball entity and cache its position component."""
+        self.ball = self.entity_factory.create_ball(x, y)
+        self._ball_pos = self.entity_manager.get_component(
+            self.ball, self.entity_factory.position_component_type)
     
     def run(self) -> None:
         """Start the main game loop."""
@@ -137,40 +160,67 @@ class Game:
         print("  ESC: Quit game")
         print("  P: Pause/Unpause")
         
+        # Bind the per-frame calls once outside the loop
+        tick = self.clock.tick
+        handle_events = self._handle_events
+        update_game = self._update_game
+        render_game = self._render_game
+        update_performance_stats = self._update_performance_stats
+        
         while self.running:
-            dt = self.clock.tick(self.config.TARGET_FPS) / 1000.0  # Convert to seconds
+            dt = tick(self.config.TARGET_FPS) / 1000.0  # Convert to seconds
             
-            self._handle_events()
+            handle_events()
             
             if not self.paused:
-                self._update_game(dt)
+                update_game(dt)
             
-            self._render_game()
+            render_game()
             
             # Update performance stats
-            self._update_performance_stats(dt)
+            update_performance_stats(dt)
         
         self._cleanup()
     
     def _handle_events(self) -> None:
         """Handle pygame events."""
+        quit_event = pygame.QUIT
+        keydown_event = pygame.KEYDOWN
+        expose_events = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+        key_handlers = self._key_handlers
+        handle_input = self.input_system.handle_event
+        
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type == quit_event:
                 self.running = False
             
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                elif event.key == pygame.K_p:
-                    self.paused = not self.paused
-                    print("Game Paused" if self.paused else "Game Resumed")
-                elif event.key == pygame.K_r:
-                    self._reset_game()
-                elif event.key == pygame.K_F1:
-                    self._toggle_debug_mode()
+            elif event.type == keydown_event:
+                handler = key_handlers.get(event.key)
+                if handler:
+                    handler()
+            
+            elif event.type in expose_events:
+                # The window contents were lost or damaged
+                self._request_full_redraw()
             
             # Let input system handle other events
-            self.input_system.handle_event(event)
+            handle_input(event)
+    
+    def _quit(self) -> None:
+        """Stop the game loop."""
+        self.running = False
+    
+    def _toggle_pause(self) -> None:
+        """Pause or unpause the game."""
+        self.paused = not self.paused
+        if not self.paused:
+            self._request_full_redraw()
+        print("Game Paused" if self.paused else "Game Resumed")
+    
+    def _request_full_redraw(self) -> None:
+        """Redraw and present the whole screen on the next frame."""
+        self.render_system.request_full_redraw()
+        self._needs_flip = True
     
     def _update_game(self, dt: float) -> None:
         """Update all game systems."""
@@ -189,25 +239,32 @@ class Game:
     def _render_game(self) -> None:
         """Render the game (handled by render system)."""
         # The render system handles all rendering
-        # Just update the display
-        pygame.display.flip()
+        # Just update the display, limited to the redrawn areas if known
+        render_system = self.render_system
+        dirty_rects = render_system.dirty_rects
+        if dirty_rects is None or self._needs_flip:
+            pygame.display.flip()
+            self._needs_flip = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+        
+        # Presented; nothing is left to update until the next render pass
+        # (none runs while paused)
+        render_system.dirty_rects = []
     
     def _check_scoring(self) -> None:
         """Check if a player has scored."""
-        if not self.ball:
-            return
-        
-        ball_pos = self.entity_manager.get_component(self.ball, 
-            self.entity_factory.position_component_type)
-        
+        ball_pos = self._ball_pos
         if ball_pos:
-            # Check if ball went off left or right side
-            if ball_pos.x < 0:
+            # Check if ball went off left or right side (one store read
+            # for both tests)
+            ball_x = ball_pos.x
+            if ball_x < 0:
                 # Player 2 scores
                 self.player2_score += 1
                 print(f"Player 2 scores! Score: {self.player1_score} - {self.player2_score}")
                 self._reset_ball()
-            elif ball_pos.x > self.config.SCREEN_WIDTH:
+            elif ball_x > self.config.SCREEN_WIDTH:
                 # Player 1 scores
                 self.player1_score += 1
                 print(f"Player 1 scores! Score: {self.player1_score} - {self.player2_score}")
@@ -227,11 +284,11 @@ class Game:
     
     def _reset_ball(self) -> None:
         """Reset the ball to center with random direction."""
-        if self.ball:
-            self.entity_manager.destroy_entity(self.ball)
-        
         center_x, center_y = self.config.get_screen_center()
-        self.ball = self.entity_factory.create_ball(center_x, center_y)
+        if self.ball:
+            self.entity_factory.serve_ball(self.ball, center_x, center_y)
+        else:
+            self._create_ball(center_x, center_y)
     
     def _reset_game(self) -> None:
         """Reset the entire game."""
@@ -244,20 +301,17 @@ class Game:
         # Reset ball
         self._reset_ball()
         
+        # Remove any effect particles
+        self.particle_system.clear()
+        
         # Reset paddle positions
         left_pos, right_pos = self.config.get_paddle_positions()
         
+        store = self.entity_manager.store
         if self.player1_paddle:
-            paddle_pos = self.entity_manager.get_component(self.player1_paddle,
-                self.entity_factory.position_component_type)
-            if paddle_pos:
-                paddle_pos.set_position(left_pos[0], left_pos[1])
-        
+            store.pos_x[self.player1_paddle], store.pos_y[self.player1_paddle] = left_pos
         if self.player2_paddle:
-            paddle_pos = self.entity_manager.get_component(self.player2_paddle,
-                self.entity_factory.position_component_type)
-            if paddle_pos:
-                paddle_pos.set_position(right_pos[0], right_pos[1])
+            store.pos_x[self.player2_paddle], store.pos_y[self.player2_paddle] = right_pos
         
         self.paused = False
     
@@ -272,7 +326,7 @@ class Game:
     def _update_performance_stats(self, dt: float) -> None:
         """Update performance statistics."""
         self.frame_count += 1
-        current_time = time.time()
+        current_time = time.perf_counter()
         
         # Update FPS display every second
         if current_time - self.last_fps_update >= 1.0:
@@ -0,0 +1,22 @@
+"""
+Optional JIT compilation support.
+
+Numba is an optional performance dependency. When it is installed, ``njit``
+compiles numeric kernels to machine code; otherwise the kernels run as
+regular Python functions with identical results.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
@@ -4,6 +4,7 @@ Entity factory for creating game entities.
 
 import random
 import math
+import numpy as np
 
 from ..core.ecs import EntityID
 from ..core.ecs.entity_manager import EntityManager
@@ -21,8 +22,21 @@ class EntityFactory:
     
     This class provides convenient methods for creating common game entities
     like paddles, balls, and UI elements with appropriate components.
+    
+    Entity sizes, speeds and bounce factors are read from the config once,
+    when the factory is created.
     """
     
+    # Paddle colors by player number (index 0 for any other player)
+    PADDLE_COLORS = (
+        (255, 255, 255),  # White
+        (100, 150, 255),  # Light blue
+        (255, 100, 100),  # Light red
+    )
+    
+    # Number of evenly spaced serve angles between -45 and +45 degrees
+    SERVE_ANGLE_STEPS = 32
+    
     def __init__(self, entity_manager: EntityManager, config: GameConfig):
         self.entity_manager = entity_manager
         self.config = config
@@ -33,6 +47,26 @@ class EntityFactory:
         self.render_component_type = RenderComponent
         self.collision_component_type = CollisionComponent
         self.input_component_type = InputComponent
+        
+        # Config values used on every create call
+        self._paddle_width = config.PADDLE_WIDTH
+        self._paddle_height = config.PADDLE_HEIGHT
+        self._paddle_speed = config.PADDLE_SPEED
+        self._paddle_bounce = config.PADDLE_BOUNCE_FACTOR
+        self._ball_size = config.BALL_SIZE
+        self._ball_speed = config.BALL_SPEED
+        self._max_ball_speed = config.MAX_BALL_SPEED
+        self._ball_bounce = config.BALL_BOUNCE_FACTOR
+        self._wall_bounce = config.WALL_BOUNCE_FACTOR
+        
+        # Serve velocities for every angle, to the left and to the right,
+        # so serving is a table pick instead of a cos/sin evaluation
+        angles = np.linspace(-math.pi/4, math.pi/4, self.SERVE_ANGLE_STEPS).tolist()
+        self._serve_velocities = [
+            (direction * self._ball_speed * math.cos(angle), self._ball_speed * math.sin(angle))
+            for direction in (-1, 1)
+            for angle in angles
+        ]
     
     def create_paddle(self, x: float, y: float, player_number: int = 1) -> EntityID:
         """
@@ -56,20 +90,16 @@ class EntityFactory:
         velocity = VelocityComponent(
             dx=0.0, 
             dy=0.0, 
-            max_speed=self.config.PADDLE_SPEED
+            max_speed=self._paddle_speed
         )
         self.entity_manager.add_component(entity, velocity)
         
         # Render component
-        paddle_color = (255, 255, 255)  # White
-        if player_number == 1:
-            paddle_color = (100, 150, 255)  # Light blue
-        elif player_number == 2:
-            paddle_color = (255, 100, 100)  # Light red
+        paddle_color = self.PADDLE_COLORS[player_number if player_number in (1, 2) else 0]
         
         render = RenderComponent(
-            width=self.config.PADDLE_WIDTH,
-            height=self.config.PADDLE_HEIGHT,
+            width=self._paddle_width,
+            height=self._paddle_height,
             color=paddle_color,
             layer=1
         )
@@ -77,19 +107,19 @@ class EntityFactory:
         
         # Collision component
         collision = CollisionComponent(
-            width=self.config.PADDLE_WIDTH,
-            height=self.config.PADDLE_HEIGHT,
+            width=self._paddle_width,
+            height=self._paddle_height,
             collision_type=CollisionType.PADDLE,
             solid=True,
-            bounce_factor=self.config.PADDLE_BOUNCE_FACTOR,
-            collision_mask=[CollisionType.BALL.value]  # Only collide with balls
+            bounce_factor=self._paddle_bounce,
+            collision_mask=CollisionType.BALL  # Only collide with balls
         )
         self.entity_manager.add_component(entity, collision)
         
         # Input component
         input_comp = InputComponent(
             enabled=True,
-            move_speed=self.config.PADDLE_SPEED
+            move_speed=self._paddle_speed
         )
         input_comp.setup_default_bindings(player_number)
         self.entity_manager.add_component(entity, input_comp)
@@ -114,23 +144,19 @@ class EntityFactory:
         self.entity_manager.add_component(entity, position)
         
         # Velocity component with random initial direction
-        angle = random.uniform(-math.pi/4, math.pi/4)  # Random angle ±45 degrees
-        direction = random.choice([-1, 1])  # Random left or right
-        
-        initial_vx = direction * self.config.BALL_SPEED * math.cos(angle)
-        initial_vy = self.config.BALL_SPEED * math.sin(angle)
+        initial_vx, initial_vy = self._random_ball_velocity()
         
         velocity = VelocityComponent(
             dx=initial_vx,
             dy=initial_vy,
-            max_speed=self.config.MAX_BALL_SPEED
+            max_speed=self._max_ball_speed
         )
         self.entity_manager.add_component(entity, velocity)
         
         # Render component
         render = RenderComponent(
-            width=self.config.BALL_SIZE,
-            height=self.config.BALL_SIZE,
+            width=self._ball_size,
+            height=self._ball_size,
             color=(255, 255, 255),  # White
             layer=2  # Above paddles
         )
@@ -138,20 +164,38 @@ class EntityFactory:
         
         # Collision component
         collision = CollisionComponent(
-            width=self.config.BALL_SIZE,
-            height=self.config.BALL_SIZE,
+            width=self._ball_size,
+            height=self._ball_size,
             collision_type=CollisionType.BALL,
             solid=False,  # Ball doesn't block movement
-            bounce_factor=self.config.BALL_BOUNCE_FACTOR,
-            collision_mask=[
-                CollisionType.PADDLE.value,
-                CollisionType.WALL.value
-            ]
+            bounce_factor=self._ball_bounce,
+            collision_mask=CollisionType.PADDLE | CollisionType.WALL
         )
         self.entity_manager.add_component(entity, collision)
         
         return entity
     
+    def serve_ball(self, entity: EntityID, x: float, y: float) -> None:
+        """
+        Move an existing ball back to a position with a new random velocity.
+        
+        The ball's rows in the ComponentStore are written directly, so the
+        entity and its components are reused rather than rebuilt.
+        
+        Args:
+            entity: Entity ID of the ball
+            x: X position
+            y: Y position
+        """
+        store = self.entity_manager.store
+        store.pos_x[entity] = x
+        store.pos_y[entity] = y
+        store.vel_dx[entity], store.vel_dy[entity] = self._random_ball_velocity()
+    
+    def _random_ball_velocity(self) -> tuple:
+        """Get a ball serve velocity at a random angle (±45 degrees) to the left or right."""
+        return random.choice(self._serve_velocities)
+    
     def create_wall(self, x: float, y: float, width: float, height: float) -> EntityID:
         """
         Create a wall entity.
@@ -187,8 +231,8 @@ class EntityFactory:
             height=height,
             collision_type=CollisionType.WALL,
             solid=True,
-            bounce_factor=self.config.WALL_BOUNCE_FACTOR,
-            collision_mask=[CollisionType.BALL.value]
+            bounce_factor=self._wall_bounce,
+            collision_mask=CollisionType.BALL
         )
         self.entity_manager.add_component(entity, collision)
         
@@ -234,49 +278,8 @@ class EntityFactory:
             solid=False,
             trigger=True,
             bounce_factor=0.0,
-            collision_mask=[CollisionType.BALL.value]
+            collision_mask=CollisionType.BALL
         )
         self.entity_manager.add_component(entity, collision)
         
-        return entity
-    
-    def create_particle(self, x: float, y: float, vx: float, vy: float, 
-                       color: tuple, lifetime: float) -> EntityID:
-        """
-        Create a particle entity for effects.
-        
-        Args:
-            x: X position
-            y: Y position
-            vx: X velocity
-            vy: Y velocity
-            color: RGB color tuple
-            lifetime: How long the particle should live in seconds
-            
-        Returns:
-            Entity ID of the created particle
-        """
-        entity = self.entity_manager.create_entity()
-        
-        # Position component
-        position = PositionComponent(x=x, y=y)
-        self.entity_manager.add_component(entity, position)
-        
-        # Velocity component
-        velocity = VelocityComponent(dx=vx, dy=vy)
-        self.entity_manager.add_component(entity, velocity)
-        
-        # Render component
-        render = RenderComponent(
-            width=2.0,
-            height=2.0,
-            color=color,
-            layer=3,  # Above everything else
-            alpha=255
-        )
-        self.entity_manager.add_component(entity, render)
-        
-        # Note: In a full implementation, you'd add a LifetimeComponent
-        # to handle automatic destruction after the lifetime expires
-        
-        return entity 
\ No newline at end of file
+        return entity
\ No newline at end of file
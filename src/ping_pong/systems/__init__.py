@@ -9,10 +9,12 @@ from .movement import MovementSystem
 from .collision import CollisionSystem
 from .input import InputSystem
 from .render import RenderSystem
+from .particle import ParticleSystem
 
 __all__ = [
     "MovementSystem",
     "CollisionSystem", 
     "InputSystem",
-    "RenderSystem"
+    "RenderSystem",
+    "ParticleSystem"
 ] 
\ No newline at end of file
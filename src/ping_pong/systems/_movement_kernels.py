@@ -0,0 +1,27 @@
+"""
+Numeric kernels for the movement system.
+
+These functions operate on the ComponentStore arrays and are compiled with
+Numba when it is available.
+"""
+
+import numpy as np
+
+from ..core.jit import njit
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def integrate_positions(pos_x: np.ndarray, pos_y: np.ndarray,
+                        vel_dx: np.ndarray, vel_dy: np.ndarray,
+                        dt: float) -> None:
+    """
+    Advance positions by velocity * dt, in place.
+    
+    Args:
+        pos_x, pos_y: Position arrays, indexed by entity ID
+        vel_dx, vel_dy: Velocity arrays, indexed by entity ID
+        dt: Delta time in seconds
+    """
+    for i in range(pos_x.shape[0]):
+        pos_x[i] += vel_dx[i] * dt
+        pos_y[i] += vel_dy[i] * dt
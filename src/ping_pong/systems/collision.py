@@ -2,16 +2,19 @@
 Collision system for collision detection and response.
 """
 
-from typing import List, Set, Type, Tuple
+from typing import List, Optional, Tuple
+import math
+import numpy as np
 import pygame
 
 from ..core.ecs import EntityID, System
-from ..core.ecs.component import Component
 from ..components.position import PositionComponent
-from ..components.velocity import VelocityComponent
+from ..components.velocity import VelocityComponent, clamp_to_max_speeds
 from ..components.collision import CollisionComponent, CollisionType
 from ..core.ecs.entity_manager import EntityManager
 from ..core.config import GameConfig
+from ._collision_kernels import sweep_pairs
+from .particle import ParticleSystem
 
 
 class CollisionSystem(System):
@@ -23,18 +26,32 @@ class CollisionSystem(System):
     such as bouncing, stopping, or triggering events.
     """
     
-    def __init__(self, entity_manager: EntityManager, config: GameConfig):
+    REQUIRED_COMPONENTS = frozenset({PositionComponent, CollisionComponent})
+    READS = frozenset({PositionComponent, CollisionComponent, VelocityComponent})
+    WRITES = frozenset({PositionComponent, VelocityComponent})
+    
+    def __init__(self, entity_manager: EntityManager, config: GameConfig,
+                 particle_system: Optional[ParticleSystem] = None):
         super().__init__()
         self.entity_manager = entity_manager
         self.config = config
+        self.particle_system = particle_system  # Emits a burst on paddle hits
         self.priority = 20  # After movement, before rendering
         
         # Screen boundaries for wall collisions
         self.screen_bounds = pygame.Rect(0, 0, config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-    
-    def get_required_components(self) -> Set[Type[Component]]:
-        """Return the components required by this system."""
-        return {PositionComponent, CollisionComponent}
+        
+        # Physics settings; refetched every update, which is free unless a
+        # setting changed since the last frame
+        self.physics = config.snapshot()
+        
+        # Register the SoA arrays used by the broad phase and the bounces
+        # (velocity is optional, so its arrays may not exist yet otherwise)
+        entity_manager.store.register(self.reads)
+        self._velocity_bit = np.uint64(entity_manager.store.get_mask((VelocityComponent,)))
+        
+        # Output buffer for broad-phase pairs (grown on demand)
+        self._pairs = np.empty((16, 2), dtype=np.int64)
     
     def update(self, dt: float, entities: List[EntityID]) -> None:
         """
@@ -44,100 +61,144 @@ class CollisionSystem(System):
             dt: Delta time since last frame in seconds
             entities: List of entities with required components
         """
+        self.physics = self.config.snapshot()
+        
+        if not entities:
+            return
+        ids = np.fromiter(entities, dtype=np.int64, count=len(entities))
+        
         # First handle boundary collisions (walls)
-        self._handle_boundary_collisions(entities)
+        self._handle_boundary_collisions(ids)
         
         # Then handle entity-to-entity collisions
-        self._handle_entity_collisions(entities)
+        self._handle_entity_collisions(ids)
     
-    def _handle_boundary_collisions(self, entities: List[EntityID]) -> None:
-        """Handle collisions with screen boundaries."""
-        for entity_id in entities:
-            position = self.entity_manager.get_component(entity_id, PositionComponent)
-            collision = self.entity_manager.get_component(entity_id, CollisionComponent)
-            velocity = self.entity_manager.get_component(entity_id, VelocityComponent)
-            
-            if not (position and collision):
-                continue
-            
-            # Get collision bounds
-            left, top, right, bottom = collision.get_collision_bounds(position.x, position.y)
-            
-            # Check boundary collisions
-            hit_boundary = False
-            
-            # Left and right boundaries - allow ball to pass through for scoring
-            # Only bounce paddles and other non-ball objects
-            if left <= 0:
-                if collision.collision_type != CollisionType.BALL:
-                    position.x = collision.width / 2
-                    hit_boundary = True
-            
-            # Right boundary  
-            elif right >= self.config.SCREEN_WIDTH:
-                if collision.collision_type != CollisionType.BALL:
-                    position.x = self.config.SCREEN_WIDTH - collision.width / 2
-                    hit_boundary = True
-            
-            # Top boundary
-            if top <= 0:
-                position.y = collision.height / 2
-                if velocity and collision.collision_type == CollisionType.BALL:
-                    velocity.reflect_y()
-                    velocity.scale_velocity(collision.bounce_factor)
-                hit_boundary = True
-            
-            # Bottom boundary
-            elif bottom >= self.config.SCREEN_HEIGHT:
-                position.y = self.config.SCREEN_HEIGHT - collision.height / 2
-                if velocity and collision.collision_type == CollisionType.BALL:
-                    velocity.reflect_y()
-                    velocity.scale_velocity(collision.bounce_factor)
-                hit_boundary = True
-            
-            # Keep paddles within screen bounds
-            if collision.collision_type == CollisionType.PADDLE:
-                if top < 0:
-                    position.y = collision.height / 2
-                elif bottom > self.config.SCREEN_HEIGHT:
-                    position.y = self.config.SCREEN_HEIGHT - collision.height / 2
+    def _handle_boundary_collisions(self, ids: np.ndarray) -> None:
+        """
+        Handle collisions with screen boundaries.
+        
+        All entities are clamped at once on the store arrays. The bounds
+        math is done in float64, as it was for the per-entity floats.
+        
+        Args:
+            ids: Entity IDs with position and collision components
+        """
+        store = self.entity_manager.store
+        screen_width = self.physics.screen_width
+        screen_height = self.physics.screen_height
+        
+        pos_x = store.pos_x[ids].astype(np.float64)
+        pos_y = store.pos_y[ids].astype(np.float64)
+        half_w = store.col_half_w[ids].astype(np.float64)
+        half_h = store.col_half_h[ids].astype(np.float64)
+        is_ball = store.col_type[ids] == CollisionType.BALL
+        
+        # Left and right boundaries - allow ball to pass through for scoring
+        # Only push back paddles and other non-ball objects
+        hit_left = (pos_x - half_w <= 0) & ~is_ball
+        hit_right = (pos_x + half_w >= screen_width) & ~is_ball & ~hit_left
+        pos_x = np.where(hit_left, half_w, pos_x)
+        pos_x = np.where(hit_right, screen_width - half_w, pos_x)
+        store.pos_x[ids] = pos_x
+        
+        # Top and bottom boundaries
+        hit_top = pos_y - half_h <= 0
+        hit_bottom = (pos_y + half_h >= screen_height) & ~hit_top
+        pos_y = np.where(hit_top, half_h, pos_y)
+        pos_y = np.where(hit_bottom, screen_height - half_h, pos_y)
+        store.pos_y[ids] = pos_y
+        
+        # Balls bounce off the top and bottom
+        bounced = (hit_top | hit_bottom) & is_ball
+        if bounced.any():
+            self._bounce_y(ids[bounced])
+    
+    def _bounce_y(self, ids: np.ndarray) -> None:
+        """
+        Reflect vertical velocity and apply the bounce factor.
+        
+        Equivalent to VelocityComponent.reflect_y() followed by
+        scale_velocity(bounce_factor), including the max speed clamp.
+        
+        Args:
+            ids: Entity IDs that hit the top or bottom boundary
+        """
+        store = self.entity_manager.store
+        
+        # Only entities that have a velocity can bounce
+        ids = ids[(store.mask[ids] & self._velocity_bit) != 0]
+        if not len(ids):
+            return
+        
+        bounce = store.col_bounce[ids]
+        dx = store.vel_dx[ids] * bounce
+        dy = -store.vel_dy[ids] * bounce
+        clamp_to_max_speeds(dx, dy, store.vel_max_speed[ids])
+        
+        store.vel_dx[ids] = dx
+        store.vel_dy[ids] = dy
     
-    def _handle_entity_collisions(self, entities: List[EntityID]) -> None:
+    def _handle_entity_collisions(self, ids: np.ndarray) -> None:
         """Handle collisions between entities."""
-        # Check all pairs of entities for collisions
-        for i, entity_a in enumerate(entities):
-            for entity_b in entities[i + 1:]:
-                self._check_collision_pair(entity_a, entity_b)
+        if len(ids) < 2:
+            return
+        
+        # Broad phase: find overlapping boxes on the store arrays
+        store = self.entity_manager.store
+        args = (ids, store.pos_x, store.pos_y, store.col_half_w, store.col_half_h,
+                store.col_type, store.col_mask)
+        
+        count = sweep_pairs(*args, self._pairs)
+        if count > len(self._pairs):
+            self._pairs = np.empty((count * 2, 2), dtype=np.int64)
+            count = sweep_pairs(*args, self._pairs)
+        
+        # Narrow phase: check collision rules and resolve each candidate pair
+        for entity_a, entity_b in self._pairs[:count].tolist():
+            self._check_collision_pair(entity_a, entity_b)
     
     def _check_collision_pair(self, entity_a: EntityID, entity_b: EntityID) -> None:
-        """Check collision between two specific entities."""
-        # Get components for both entities
-        pos_a = self.entity_manager.get_component(entity_a, PositionComponent)
-        col_a = self.entity_manager.get_component(entity_a, CollisionComponent)
-        vel_a = self.entity_manager.get_component(entity_a, VelocityComponent)
+        """
+        Check collision between two specific entities.
         
-        pos_b = self.entity_manager.get_component(entity_b, PositionComponent)
-        col_b = self.entity_manager.get_component(entity_b, CollisionComponent)
-        vel_b = self.entity_manager.get_component(entity_b, VelocityComponent)
+        The broad phase only reports pairs whose collision masks accept
+        each other's type, so that rule is not checked again here. The
+        overlap is tested again because resolving an earlier pair may have
+        moved either entity; the test reads the store arrays directly, so
+        the components are only fetched for pairs that still overlap.
+        """
+        store = self.entity_manager.store
+        pos_x, pos_y = store.pos_x, store.pos_y
+        half_w, half_h = store.col_half_w, store.col_half_h
         
-        if not (pos_a and col_a and pos_b and col_b):
-            return
+        # Collision bounds as plain floats (no Rect allocation)
+        ax, ay = pos_x[entity_a].item(), pos_y[entity_a].item()
+        a_half_w, a_half_h = half_w[entity_a].item(), half_h[entity_a].item()
+        bx, by = pos_x[entity_b].item(), pos_y[entity_b].item()
+        b_half_w, b_half_h = half_w[entity_b].item(), half_h[entity_b].item()
         
-        # Check if these collision types can interact
-        if not (col_a.can_collide_with(col_b.collision_type) and 
-                col_b.can_collide_with(col_a.collision_type)):
+        # Check for AABB overlap
+        if not (ax - a_half_w < bx + b_half_w and bx - b_half_w < ax + a_half_w and
+                ay - a_half_h < by + b_half_h and by - b_half_h < ay + a_half_h):
             return
         
-        # Get collision rectangles
-        rect_a = col_a.get_collision_rect(pos_a.x, pos_a.y)
-        rect_b = col_b.get_collision_rect(pos_b.x, pos_b.y)
+        # Get components for both entities
+        get_component = self.entity_manager.get_component
+        pos_a = get_component(entity_a, PositionComponent)
+        col_a = get_component(entity_a, CollisionComponent)
+        vel_a = get_component(entity_a, VelocityComponent)
+        
+        pos_b = get_component(entity_b, PositionComponent)
+        col_b = get_component(entity_b, CollisionComponent)
+        vel_b = get_component(entity_b, VelocityComponent)
         
-        # Check for collision
-        if rect_a.colliderect(rect_b):
-            self._resolve_collision(
-                entity_a, pos_a, col_a, vel_a,
-                entity_b, pos_b, col_b, vel_b
-            )
+        if not (pos_a and col_a and pos_b and col_b):
+            return
+        
+        self._resolve_collision(
+            entity_a, pos_a, col_a, vel_a,
+            entity_b, pos_b, col_b, vel_b
+        )
     
     def _resolve_collision(self, 
                           entity_a: EntityID, pos_a: PositionComponent, 
@@ -163,41 +224,52 @@ class CollisionSystem(System):
                 hit_offset = (ball_pos.y - paddle_pos.y) / (paddle_col.height / 2)
                 hit_offset = max(-1.0, min(1.0, hit_offset))  # Clamp to [-1, 1]
                 
-                # Reflect ball horizontally
-                ball_vel.reflect_x()
+                # Reflect horizontally, add a vertical component based on the
+                # hit position, then apply bounce factor and speed increase.
+                # Done on locals with one store write per field instead of
+                # going through the VelocityComponent helpers.
+                physics = self.physics
+                factor = ball_col.bounce_factor * physics.ball_speed_increase
+                dx = -ball_vel.dx * factor
+                dy = (ball_vel.dy + hit_offset * 100) * factor  # Adjust this multiplier as needed
                 
-                # Add vertical component based on hit position
-                ball_vel.dy += hit_offset * 100  # Adjust this multiplier as needed
+                # Clamp to the tighter of the ball's own and the physics limit
+                max_speed = physics.max_ball_speed
+                own_max = ball_vel.max_speed
+                if 0 < own_max < max_speed:
+                    max_speed = own_max
+                speed_sq = dx * dx + dy * dy
+                if speed_sq > max_speed * max_speed:
+                    scale = max_speed / math.sqrt(speed_sq)
+                    dx *= scale
+                    dy *= scale
                 
-                # Apply bounce factor and speed increase
-                ball_vel.scale_velocity(ball_col.bounce_factor * self.config.BALL_SPEED_INCREASE)
-                
-                # Clamp to maximum speed
-                if ball_vel.get_speed() > self.config.MAX_BALL_SPEED:
-                    ball_vel.normalize(self.config.MAX_BALL_SPEED)
+                ball_vel.dx = dx
+                ball_vel.dy = dy
                 
                 # Separate the ball from paddle to prevent sticking
                 if ball_pos.x < paddle_pos.x:
                     ball_pos.x = paddle_pos.x - (paddle_col.width + ball_col.width) / 2 - 1
                 else:
                     ball_pos.x = paddle_pos.x + (paddle_col.width + ball_col.width) / 2 + 1
+                
+                if self.particle_system:
+                    self.particle_system.burst(ball_pos.x, ball_pos.y)
         
         # Handle other collision types as needed
         # For now, just basic separation for solid objects
         elif col_a.solid and col_b.solid:
             # Simple separation - move objects apart
-            dx = pos_a.x - pos_b.x
-            dy = pos_a.y - pos_b.y
-            distance = (dx * dx + dy * dy) ** 0.5
+            bx = pos_b.x
+            by = pos_b.y
+            dx = pos_a.x - bx
+            dy = pos_a.y - by
+            distance = math.hypot(dx, dy)
             
             if distance > 0:
-                # Normalize separation vector
-                dx /= distance
-                dy /= distance
-                
-                # Calculate required separation
-                sep_distance = (col_a.width + col_b.width) / 2 + 1
+                # Scale the unit separation vector by the required separation
+                scale = ((col_a.width + col_b.width) / 2 + 1) / distance
                 
                 # Move objects apart
-                pos_a.x = pos_b.x + dx * sep_distance
-                pos_a.y = pos_b.y + dy * sep_distance 
\ No newline at end of file
+                pos_a.x = bx + dx * scale
+                pos_a.y = by + dy * scale 
\ No newline at end of file
@@ -2,13 +2,13 @@
 Input system for handling player input.
 """
 
-from typing import List, Set, Type
+from typing import List, Optional, Tuple
+import numpy as np
 import pygame
 
 from ..core.ecs import EntityID, System
-from ..core.ecs.component import Component
-from ..components.input import InputComponent
-from ..components.velocity import VelocityComponent
+from ..components.input import InputComponent, get_bindings_version
+from ..components.velocity import VelocityComponent, clamp_to_max_speeds
 from ..core.ecs.entity_manager import EntityManager
 
 
@@ -21,17 +21,35 @@ class InputSystem(System):
     or other components based on input actions.
     """
     
+    REQUIRED_COMPONENTS = frozenset({InputComponent})
+    READS = frozenset({InputComponent})
+    WRITES = frozenset({VelocityComponent})
+    
     def __init__(self, entity_manager: EntityManager):
         super().__init__()
         self.entity_manager = entity_manager
         self.priority = 5  # Very early in the update cycle
         
-        # Track current input state
-        self.current_keys: Set[int] = set()
-    
-    def get_required_components(self) -> Set[Type[Component]]:
-        """Return the components required by this system."""
-        return {InputComponent}
+        # Track current input state: one bit per watched key
+        self.current_keys_mask = 0
+        
+        # Cached (entity, input, velocity) tuples, rebuilt when the entity
+        # manager's structure version changes
+        self._view: List[Tuple[EntityID, InputComponent, Optional[VelocityComponent]]] = []
+        self._view_version = -1
+        
+        # Input entities that also have a velocity, with per-frame buffers
+        # for their enabled flags and input velocities
+        self._moving_ids = np.empty(0, dtype=np.int64)
+        self._moving_inputs: List[InputComponent] = []
+        self._active = np.empty(0, dtype=bool)
+        self._input_dx = np.empty(0, dtype=np.float32)
+        self._input_dy = np.empty(0, dtype=np.float32)
+        
+        # (key code, bit) for every key bound by an input entity; only
+        # these are polled
+        self._watched_keys: Tuple[Tuple[int, int], ...] = ()
+        self._watched_version = (-1, -1)
     
     def update(self, dt: float, entities: List[EntityID]) -> None:
         """
@@ -41,43 +59,95 @@ class InputSystem(System):
             dt: Delta time since last frame in seconds
             entities: List of entities with required components
         """
+        entity_manager = self.entity_manager
+        if self._view_version != entity_manager.structure_version:
+            self._rebuild_view(entities)
+            self._view_version = entity_manager.structure_version
+        
         # Get current input state from pygame
         self._update_input_state()
         
-        # Process input for each entity
-        for entity_id in entities:
-            input_comp = self.entity_manager.get_component(entity_id, InputComponent)
-            velocity_comp = self.entity_manager.get_component(entity_id, VelocityComponent)
-            
+        # Update the input state of each entity
+        pressed_mask = self.current_keys_mask
+        for _, input_comp, _ in self._view:
             if input_comp:
-                # Update input component state
-                input_comp.update_input_state(self.current_keys)
-                
-                # Apply input to velocity if entity has velocity component
-                if velocity_comp:
-                    self._apply_input_to_velocity(input_comp, velocity_comp)
+                input_comp.update_input_mask(pressed_mask)
+        
+        # Apply input to the velocity of entities that have one
+        if self._moving_inputs:
+            self._apply_input_to_velocities()
+    
+    def _rebuild_view(self, entities: List[EntityID]) -> None:
+        """Rebuild the cached component view and the moving entity arrays."""
+        self._view = self.entity_manager.get_component_view(
+            entities, (InputComponent, VelocityComponent)
+        )
+        
+        moving = [(entity_id, input_comp) for entity_id, input_comp, velocity_comp in self._view
+                  if input_comp and velocity_comp]
+        count = len(moving)
+        self._moving_ids = np.fromiter((entity_id for entity_id, _ in moving),
+                                       dtype=np.int64, count=count)
+        self._moving_inputs = [input_comp for _, input_comp in moving]
+        self._active = np.empty(count, dtype=bool)
+        self._input_dx = np.empty(count, dtype=np.float32)
+        self._input_dy = np.empty(count, dtype=np.float32)
     
     def _update_input_state(self) -> None:
         """Update the current input state from pygame."""
-        # Get currently pressed keys
-        pressed_keys = pygame.key.get_pressed()
-        
-        # Convert to set of key codes
-        self.current_keys.clear()
-        for key_code in range(len(pressed_keys)):
-            if pressed_keys[key_code]:
-                self.current_keys.add(key_code)
+        version = (self._view_version, get_bindings_version())
+        if self._watched_version != version:
+            self._assign_key_bits()
+            self._watched_version = version
+        
+        # Only the bound keys matter, so test those instead of the whole
+        # keyboard (the wrapper accepts key codes directly)
+        pressed = pygame.key.get_pressed()
+        mask = 0
+        for key_code, bit in self._watched_keys:
+            if pressed[key_code]:
+                mask |= bit
+        self.current_keys_mask = mask
     
-    def _apply_input_to_velocity(self, input_comp: InputComponent, velocity_comp: VelocityComponent) -> None:
-        """Apply input actions to velocity component."""
-        if not input_comp.enabled:
-            return
+    def _assign_key_bits(self) -> None:
+        """Give every bound key a bit and pass the layout to the components."""
+        input_comps = [input_comp for _, input_comp, _ in self._view if input_comp]
+        
+        watched = set()
+        for input_comp in input_comps:
+            watched |= input_comp.get_bound_keys()
+        key_bits = {key_code: 1 << index for index, key_code in enumerate(sorted(watched))}
         
-        # Get movement velocity from input
-        vx, vy = input_comp.get_movement_velocity()
+        for input_comp in input_comps:
+            input_comp.assign_key_bits(key_bits)
+        self._watched_keys = tuple(key_bits.items())
+    
+    def _apply_input_to_velocities(self) -> None:
+        """
+        Apply input actions to the velocity of every moving input entity.
+        
+        Equivalent to VelocityComponent.set_velocity() with each enabled
+        component's movement velocity, but the speed clamp and the store
+        writes are done as array operations. Entities with input disabled
+        keep their velocity.
+        """
+        active = self._active
+        input_dx = self._input_dx
+        input_dy = self._input_dy
+        for index, input_comp in enumerate(self._moving_inputs):
+            active[index] = input_comp.enabled
+            input_dx[index], input_dy[index] = input_comp.get_movement_velocity()
+        
+        ids = self._moving_ids[active]
+        if not len(ids):
+            return
         
-        # Set velocity based on input
-        velocity_comp.set_velocity(vx, vy)
+        store = self.entity_manager.store
+        dx = input_dx[active]
+        dy = input_dy[active]
+        clamp_to_max_speeds(dx, dy, store.vel_max_speed[ids])
+        store.vel_dx[ids] = dx
+        store.vel_dy[ids] = dy
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -2,13 +2,16 @@
 Movement system for updating entity positions based on velocity.
 """
 
-from typing import List, Set, Type
+from typing import List
+
+import numpy as np
 
 from ..core.ecs import EntityID, System
-from ..core.ecs.component import Component
+from ..core.jit import NUMBA_AVAILABLE
 from ..components.position import PositionComponent
 from ..components.velocity import VelocityComponent
 from ..core.ecs.entity_manager import EntityManager
+from ._movement_kernels import integrate_positions
 
 
 class MovementSystem(System):
@@ -18,16 +21,36 @@ class MovementSystem(System):
     This system processes all entities that have both PositionComponent
     and VelocityComponent, updating their positions each frame based on
     their velocity and the frame delta time.
+    
+    Positions are integrated as whole-array operations on the
+    ComponentStore. Entities without a velocity have zero velocity in
+    the store, so they are unaffected. With Numba installed the
+    integration runs as a compiled kernel; otherwise update() does it with
+    NumPy.
     """
     
+    REQUIRED_COMPONENTS = frozenset({PositionComponent, VelocityComponent})
+    READS = frozenset({VelocityComponent})
+    WRITES = frozenset({PositionComponent})
+    
+    kernel = staticmethod(integrate_positions) if NUMBA_AVAILABLE else None
+    
     def __init__(self, entity_manager: EntityManager):
         super().__init__()
         self.entity_manager = entity_manager
         self.priority = 10  # Early in the update cycle
+        
+        # Register the SoA arrays this system reads and writes
+        entity_manager.store.register(self._required)
+        
+        # Scratch buffer reused every frame to avoid temporaries
+        self._tmp = np.empty(entity_manager.store.capacity, dtype=np.float32)
     
-    def get_required_components(self) -> Set[Type[Component]]:
-        """Return the components required by this system."""
-        return {PositionComponent, VelocityComponent}
+    def kernel_args(self) -> tuple:
+        """Return the position and velocity arrays of all stored entities."""
+        store = self.entity_manager.store
+        n = store.size
+        return store.pos_x[:n], store.pos_y[:n], store.vel_dx[:n], store.vel_dy[:n]
     
     def update(self, dt: float, entities: List[EntityID]) -> None:
         """
@@ -37,11 +60,15 @@ class MovementSystem(System):
             dt: Delta time since last frame in seconds
             entities: List of entities with required components
         """
-        for entity_id in entities:
-            position = self.entity_manager.get_component(entity_id, PositionComponent)
-            velocity = self.entity_manager.get_component(entity_id, VelocityComponent)
-            
-            if position and velocity:
-                # Update position based on velocity and delta time
-                position.x += velocity.dx * dt
-                position.y += velocity.dy * dt 
\ No newline at end of file
+        store = self.entity_manager.store
+        n = store.size
+        
+        if len(self._tmp) < n:
+            self._tmp = np.empty(store.capacity, dtype=np.float32)
+        tmp = self._tmp[:n]
+        
+        # Update positions based on velocity and delta time
+        np.multiply(store.vel_dx[:n], dt, out=tmp)
+        store.pos_x[:n] += tmp
+        np.multiply(store.vel_dy[:n], dt, out=tmp)
+        store.pos_y[:n] += tmp 
\ No newline at end of file
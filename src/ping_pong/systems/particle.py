@@ -0,0 +1,193 @@
+"""
+Particle system for short-lived visual effects.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from ..core.ecs import EntityID, System
+
+# Initial number of particle slots (arrays grow by doubling when exceeded)
+MAX_PARTICLES = 256
+
+# Default burst: particle count, speed (pixels/second), lifetime (seconds), color
+BURST_COUNT = 12
+BURST_SPEED = 120.0
+BURST_LIFETIME = 0.35
+BURST_COLOR = (255, 255, 255)
+
+
+class ParticleSystem(System):
+    """
+    System that moves and expires effect particles.
+    
+    Particles never interact with anything, so they are not ECS entities:
+    they live in the system's own Struct-of-Arrays columns (position,
+    velocity, lifetime and color per slot), and each frame is a handful of
+    whole-array operations. Expired slots go onto a free list and are
+    reused by the next emit().
+    
+    The CollisionSystem emits a burst() on every ball-paddle hit, and the
+    RenderSystem draws the live particles above all entities.
+    """
+    
+    READS = frozenset()
+    WRITES = frozenset()
+    
+    def __init__(self, capacity: int = MAX_PARTICLES):
+        super().__init__()
+        self.priority = 15  # After movement, independent of the entities
+        
+        self.capacity = 0
+        self.xs = np.zeros(0, dtype=np.float32)
+        self.ys = np.zeros(0, dtype=np.float32)
+        self.vxs = np.zeros(0, dtype=np.float32)
+        self.vys = np.zeros(0, dtype=np.float32)
+        self.lifetimes = np.zeros(0, dtype=np.float32)
+        self.colors = np.zeros((0, 3), dtype=np.uint8)
+        self.alive = np.zeros(0, dtype=bool)
+        
+        # Unused slots; the lowest slot is at the end and popped first
+        self._free: List[int] = []
+        self._grow(capacity)
+        
+        # Unit direction vectors for each burst size
+        self._burst_directions: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    
+    @property
+    def count(self) -> int:
+        """Number of live particles."""
+        return self.capacity - len(self._free)
+    
+    def emit(self, xs: np.ndarray, ys: np.ndarray, vxs: np.ndarray, vys: np.ndarray,
+             colors: Sequence[tuple], lifetimes: np.ndarray) -> np.ndarray:
+        """
+        Spawn particles, e.g. for a burst effect.
+        
+        Args:
+            xs, ys: Particle positions
+            vxs, vys: Particle velocities
+            colors: RGB color tuple for each particle
+            lifetimes: How long each particle lives in seconds
+        
+        Returns:
+            The slots the particles were written to
+        """
+        count = len(colors)
+        if not count:
+            return np.empty(0, dtype=np.int64)
+        if count > len(self._free):
+            self._grow(max(self.capacity * 2, self.count + count))
+        
+        slots = np.array(self._free[-count:][::-1], dtype=np.int64)
+        del self._free[-count:]
+        
+        self.xs[slots] = xs
+        self.ys[slots] = ys
+        self.vxs[slots] = vxs
+        self.vys[slots] = vys
+        self.lifetimes[slots] = lifetimes
+        self.colors[slots] = colors
+        self.alive[slots] = True
+        
+        return slots
+    
+    def burst(self, x: float, y: float, color: tuple = BURST_COLOR,
+              count: int = BURST_COUNT, speed: float = BURST_SPEED,
+              lifetime: float = BURST_LIFETIME) -> np.ndarray:
+        """
+        Emit particles flying out evenly in all directions from a point.
+        
+        Args:
+            x, y: Burst center
+            color: RGB color of every particle
+            count: Number of particles
+            speed: Particle speed in pixels per second
+            lifetime: How long the particles live in seconds
+        
+        Returns:
+            The slots the particles were written to
+        """
+        directions = self._burst_directions.get(count)
+        if directions is None:
+            angles = np.linspace(0.0, 2.0 * np.pi, count, endpoint=False)
+            directions = (np.cos(angles).astype(np.float32), np.sin(angles).astype(np.float32))
+            self._burst_directions[count] = directions
+        
+        dir_x, dir_y = directions
+        return self.emit(
+            np.full(count, x, dtype=np.float32),
+            np.full(count, y, dtype=np.float32),
+            dir_x * speed,
+            dir_y * speed,
+            [color] * count,
+            np.full(count, lifetime, dtype=np.float32),
+        )
+    
+    def update(self, dt: float, entities: List[EntityID]) -> None:
+        """
+        Advance all live particles and expire those whose lifetime ran out.
+        
+        Args:
+            dt: Delta time since last frame in seconds
+            entities: Unused; particles are not entities
+        """
+        if not self.count:
+            return
+        
+        # Free slots are at rest, so the whole arrays can be integrated
+        self.xs += self.vxs * dt
+        self.ys += self.vys * dt
+        
+        alive = self.alive
+        np.subtract(self.lifetimes, dt, out=self.lifetimes, where=alive)
+        expired = alive & (self.lifetimes <= 0.0)
+        if expired.any():
+            self._release(np.flatnonzero(expired))
+    
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draw the live particles as 2x2 pixel squares.
+        
+        Args:
+            surface: Surface to draw on
+        """
+        if not self.count:
+            return
+        
+        slots = np.flatnonzero(self.alive)
+        pixel_x = (np.rint(self.xs[slots]).astype(np.int32) - 1).tolist()
+        pixel_y = (np.rint(self.ys[slots]).astype(np.int32) - 1).tolist()
+        colors = self.colors[slots].tolist()
+        
+        fill = surface.fill
+        for x, y, color in zip(pixel_x, pixel_y, colors):
+            fill(color, (x, y, 2, 2))
+    
+    def clear(self) -> None:
+        """Remove all particles."""
+        if self.count:
+            self._release(np.flatnonzero(self.alive))
+    
+    def _release(self, slots: np.ndarray) -> None:
+        """Stop the given slots and return them to the free list."""
+        self.alive[slots] = False
+        self.vxs[slots] = 0.0
+        self.vys[slots] = 0.0
+        self.lifetimes[slots] = 0.0
+        self._free.extend(slots[::-1].tolist())
+        self._free.sort(reverse=True)
+    
+    def _grow(self, new_capacity: int) -> None:
+        """Grow every column to a new capacity and free the new slots."""
+        old_capacity = self.capacity
+        for name in ("xs", "ys", "vxs", "vys", "lifetimes", "colors", "alive"):
+            array = getattr(self, name)
+            grown = np.zeros((new_capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:old_capacity] = array
+            setattr(self, name, grown)
+        
+        self._free[:0] = range(new_capacity - 1, old_capacity - 1, -1)
+        self.capacity = new_capacity
\ No newline at end of file
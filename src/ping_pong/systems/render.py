@@ -2,15 +2,18 @@
 Render system for drawing entities to the screen.
 """
 
-from typing import List, Set, Type, Dict
+from itertools import chain
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 import pygame
 
 from ..core.ecs import EntityID, System
-from ..core.ecs.component import Component
 from ..components.position import PositionComponent
-from ..components.render import RenderComponent
+from ..components.collision import CollisionComponent
+from ..components.render import RenderComponent, get_layers_version
 from ..core.ecs.entity_manager import EntityManager
 from ..core.config import GameConfig
+from .particle import ParticleSystem
 
 
 class RenderSystem(System):
@@ -21,51 +24,141 @@ class RenderSystem(System):
     sorts them by layer, and draws them to the pygame surface.
     """
     
-    def __init__(self, entity_manager: EntityManager, config: GameConfig, screen: pygame.Surface):
+    REQUIRED_COMPONENTS = frozenset({PositionComponent, RenderComponent})
+    READS = frozenset({PositionComponent, RenderComponent, CollisionComponent})
+    WRITES = frozenset()
+    
+    def __init__(self, entity_manager: EntityManager, config: GameConfig, screen: pygame.Surface,
+                 particle_system: Optional[ParticleSystem] = None):
         super().__init__()
         self.entity_manager = entity_manager
         self.config = config
         self.screen = screen
+        self.particle_system = particle_system  # Particles drawn above all entities
         self.priority = 100  # Late in the update cycle (after all logic)
         
+        # Register the SoA position arrays read when drawing
+        entity_manager.store.register(self._required)
+        
         # Surface cache for render components
         self.surface_cache: Dict[int, pygame.Surface] = {}
         
         # Background color
         self.background_color = (0, 0, 0)  # Black
         
+        # Dirty-rect state. dirty_rects lists the screen areas redrawn by
+        # the last update (None = the whole screen), for display.update().
+        self.dirty_rects: Optional[List[pygame.Rect]] = None
+        self._full_redraw = True
+        self._had_overlay = False
+        self._drawn: Dict[EntityID, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+        self._score_blits: List[Tuple[pygame.Surface, pygame.Rect]] = []
+        
+        # The view last sorted by layer, and the layers version at the time
+        self._sorted_view: Optional[List[tuple]] = None
+        self._sorted_layers_version = -1
+        
+        # The dashed center line never changes, so it is drawn once
+        self._center_line_surface = self._create_center_line_surface()
+        
         # Score tracking
         self.player1_score = 0
         self.player2_score = 0
         
+        # Rendered score text, keyed by score value (scores change rarely)
+        self._score_surfaces: Dict[int, pygame.Surface] = {}
+        
         # Font initialization
         pygame.font.init()
         self.score_font = pygame.font.Font(None, 72)
         self.debug_font = pygame.font.Font(None, 24) if config.DEBUG_MODE else None
-    
-    def get_required_components(self) -> Set[Type[Component]]:
-        """Return the components required by this system."""
-        return {PositionComponent, RenderComponent}
+        
+        # Render every score a game can reach now, so a goal never has to
+        # rasterize text during a frame
+        for score in range(config.WINNING_SCORE + 1):
+            self._get_score_surface(score)
     
     def update(self, dt: float, entities: List[EntityID]) -> None:
         """
         Update rendering.
         
+        Normally only the areas around entities that moved or changed, and
+        around a changed score, are cleared and redrawn. The whole screen
+        is redrawn on the first frame, after a background change, and
+        while debug overlays or particles are (or just were) shown.
+        
         Args:
             dt: Delta time since last frame in seconds
             entities: List of entities with required components
         """
+        # Get renderable entities and sort by layer. The (entity, position,
+        # render) view is cached by the entity manager between structural
+        # changes, so no component lookups happen here, and it stays sorted
+        # until it is rebuilt or a layer changes.
+        renderable_entities = self.entity_manager.get_archetype_view(
+            (PositionComponent, RenderComponent)
+        )
+        layers_version = get_layers_version()
+        if (renderable_entities is not self._sorted_view or
+                self._sorted_layers_version != layers_version):
+            renderable_entities.sort(key=lambda x: x[2].layer)  # Sort by layer
+            if self._sorted_layers_version != layers_version:
+                # Entities that did not move may now overlap differently
+                self._full_redraw = True
+            self._sorted_view = renderable_entities
+            self._sorted_layers_version = layers_version
+        
+        # Snap the float32 store positions to whole pixels in one pass
+        store = self.entity_manager.store
+        n = store.size
+        pixel_x = np.rint(store.pos_x[:n]).astype(np.int32).tolist()
+        pixel_y = np.rint(store.pos_y[:n]).astype(np.int32).tolist()
+        
+        # Collect (surface, top-left) pairs for all visible entities,
+        # centered on their positions, to draw with one blits() call.
+        # Entities entirely off screen are culled.
+        screen_width, screen_height = self.screen.get_size()
+        drawn = {}
+        for entity_id, _, render_comp in renderable_entities:
+            if render_comp.visible:
+                # The component caches its surface until it is marked dirty
+                surface = render_comp.create_surface()
+                width, height = surface.get_size()
+                left = pixel_x[entity_id] - width // 2
+                top = pixel_y[entity_id] - height // 2
+                if (left < screen_width and top < screen_height and
+                        left + width > 0 and top + height > 0):
+                    drawn[entity_id] = (surface, (left, top))
+        blit_sequence = list(drawn.values())  # Dicts keep the layer order
+        
+        config = self.config
+        overlay = (config.DEBUG_MODE or config.SHOW_COLLISION_BOXES or
+                   bool(self.particle_system and self.particle_system.count))
+        if self._full_redraw or overlay or self._had_overlay:
+            self._draw_full(dt, entities, renderable_entities, blit_sequence)
+            self.dirty_rects = None
+        else:
+            self.dirty_rects = self._draw_dirty(drawn, blit_sequence)
+        
+        self._drawn = drawn
+        self._had_overlay = overlay
+        self._full_redraw = False
+    
+    def _draw_full(self, dt: float, entities: List[EntityID],
+                   renderable_entities: List[tuple], blit_sequence: List[tuple]) -> None:
+        """Clear and redraw the whole screen."""
         # Clear screen
         self.screen.fill(self.background_color)
         
-        # Get renderable entities and sort by layer
-        renderable_entities = self._get_renderable_entities(entities)
-        renderable_entities.sort(key=lambda x: x[2].layer)  # Sort by layer
+        self.screen.blits(blit_sequence, doreturn=False)
         
-        # Render each entity
-        for entity_id, position, render_comp in renderable_entities:
-            if render_comp.visible:
-                self._render_entity(entity_id, position, render_comp)
+        # Draw collision boxes if debug mode is enabled
+        if self.config.SHOW_COLLISION_BOXES:
+            self._draw_collision_boxes(renderable_entities)
+        
+        # Draw effect particles above all entities
+        if self.particle_system:
+            self.particle_system.draw(self.screen)
         
         # Render debug information if enabled
         if self.config.DEBUG_MODE:
@@ -75,55 +168,92 @@ class RenderSystem(System):
         self._draw_center_line()
         
         # Draw scoreboard
-        self._draw_scoreboard()
-    
-    def _get_renderable_entities(self, entities: List[EntityID]) -> List[tuple]:
-        """Get entities that can be rendered, with their components."""
-        renderable = []
-        
-        for entity_id in entities:
-            position = self.entity_manager.get_component(entity_id, PositionComponent)
-            render_comp = self.entity_manager.get_component(entity_id, RenderComponent)
-            
-            if position and render_comp:
-                renderable.append((entity_id, position, render_comp))
-        
-        return renderable
-    
-    def _render_entity(self, entity_id: EntityID, position: PositionComponent, 
-                      render_comp: RenderComponent) -> None:
-        """Render a single entity."""
-        # Get or create surface for this render component
-        surface = self._get_surface_for_render_component(render_comp)
-        
-        if surface:
-            # Calculate render position (center-based)
-            render_rect = surface.get_rect()
-            render_rect.centerx = int(position.x)
-            render_rect.centery = int(position.y)
-            
-            # Draw to screen
-            self.screen.blit(surface, render_rect)
-            
-            # Draw collision box if debug mode is enabled
-            if self.config.SHOW_COLLISION_BOXES:
-                from ..components.collision import CollisionComponent
-                collision_comp = self.entity_manager.get_component(entity_id, CollisionComponent)
-                if collision_comp:
-                    self._draw_collision_box(position, collision_comp)
+        self._score_blits = self._get_score_blits()
+        self.screen.blits(self._score_blits, doreturn=False)
     
-    def _get_surface_for_render_component(self, render_comp: RenderComponent) -> pygame.Surface:
-        """Get or create a surface for a render component."""
-        # Check if surface needs to be recreated
-        if render_comp.dirty or render_comp.surface is None:
-            render_comp.surface = render_comp.create_surface()
-            render_comp.dirty = False
+    def _draw_dirty(self, drawn: Dict[EntityID, tuple], blit_sequence: List[tuple]) -> List[pygame.Rect]:
+        """
+        Redraw only the screen areas that changed since the last frame.
         
-        return render_comp.surface
+        The changed areas are merged until none overlap and cleared. Then
+        every surface touching them (entities in layer order, the center
+        line and the scores) is blitted once per area it touches, clipped to
+        that area, so overlapping entities and transparent surfaces come
+        out exactly as in a full redraw.
+        
+        Returns:
+            The redrawn areas
+        """
+        changed = []
+        previous = self._drawn
+        for entity_id, blit in drawn.items():
+            old_blit = previous.get(entity_id)
+            if old_blit != blit:
+                surface, dest = blit
+                rect = surface.get_rect(topleft=dest)
+                if old_blit:
+                    rect.union_ip(old_blit[0].get_rect(topleft=old_blit[1]))
+                changed.append(rect)
+        
+        # Entities that were removed or hidden
+        for entity_id, (surface, dest) in previous.items():
+            if entity_id not in drawn:
+                changed.append(surface.get_rect(topleft=dest))
+        
+        score_blits = self._get_score_blits()
+        if score_blits != self._score_blits:
+            changed.extend(rect for _, rect in self._score_blits)
+            changed.extend(rect for _, rect in score_blits)
+            self._score_blits = score_blits
+        
+        dirty = self._merge_rects(changed, self.screen.get_rect())
+        if not dirty:
+            return dirty
+        
+        screen = self.screen
+        for rect in dirty:
+            screen.fill(self.background_color, rect)
+        
+        center_line = (self._center_line_surface, (self.config.SCREEN_WIDTH // 2 - 2, 0))
+        clipped_blits = []
+        for surface, dest in chain(blit_sequence, (center_line,), score_blits):
+            rect = pygame.Rect((dest[0], dest[1]), surface.get_size())
+            for index in rect.collidelistall(dirty):
+                clip = rect.clip(dirty[index])
+                clipped_blits.append((surface, clip.topleft, clip.move(-rect.x, -rect.y)))
+        screen.blits(clipped_blits, doreturn=False)
+        
+        return dirty
+    
+    @staticmethod
+    def _merge_rects(rects: List[pygame.Rect], bounds: pygame.Rect) -> List[pygame.Rect]:
+        """Clip rects to the given bounds and merge them until none overlap."""
+        merged = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if not rect:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+    
+    def request_full_redraw(self) -> None:
+        """Redraw the whole screen on the next update, e.g. after an expose."""
+        self._full_redraw = True
     
     def _draw_center_line(self) -> None:
         """Draw the center line of the field."""
-        center_x = self.config.SCREEN_WIDTH // 2
+        # The line surface is padded by 2 pixels on each side of the center
+        self.screen.blit(self._center_line_surface, (self.config.SCREEN_WIDTH // 2 - 2, 0))
+    
+    def _create_center_line_surface(self) -> pygame.Surface:
+        """Draw the dashed center line onto a narrow transparent surface."""
+        screen_height = self.config.SCREEN_HEIGHT
+        surface = pygame.Surface((4, screen_height), pygame.SRCALPHA)
+        line_x = 2  # Center of the surface
         line_color = (100, 100, 100)  # Dark gray
         
         # Draw dashed center line
@@ -131,20 +261,35 @@ class RenderSystem(System):
         gap_length = 5
         y = 0
         
-        while y < self.config.SCREEN_HEIGHT:
+        while y < screen_height:
             pygame.draw.line(
-                self.screen,
+                surface,
                 line_color,
-                (center_x, y),
-                (center_x, min(y + dash_length, self.config.SCREEN_HEIGHT)),
+                (line_x, y),
+                (line_x, min(y + dash_length, screen_height)),
                 2
             )
             y += dash_length + gap_length
+        
+        # Match the display pixel format so the blit doesn't convert per pixel
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        
+        return surface
+    
+    def _draw_collision_boxes(self, renderable_entities: List[tuple]) -> None:
+        """Draw the collision boxes of visible entities for debugging."""
+        get_component = self.entity_manager.get_component
+        for entity_id, position, render_comp in renderable_entities:
+            if render_comp.visible:
+                collision_comp = get_component(entity_id, CollisionComponent)
+                if collision_comp:
+                    self._draw_collision_box(position, collision_comp)
     
     def _draw_collision_box(self, position: PositionComponent, collision_comp) -> None:
         """Draw collision box for debugging."""
         if collision_comp:
-            rect = collision_comp.get_collision_rect(position.x, position.y)
+            rect = collision_comp.fill_rect(position.x, position.y)
             pygame.draw.rect(self.screen, (255, 0, 0), rect, 1)  # Red outline
     
     def _render_debug_info(self, dt: float, entity_count: int) -> None:
@@ -167,6 +312,7 @@ class RenderSystem(System):
     def set_background_color(self, color: tuple) -> None:
         """Set the background color."""
         self.background_color = color
+        self._full_redraw = True
     
     def clear_surface_cache(self) -> None:
         """Clear the surface cache."""
@@ -177,14 +323,11 @@ class RenderSystem(System):
         self.player1_score = player1_score
         self.player2_score = player2_score
     
-    def _draw_scoreboard(self) -> None:
-        """Draw the scoreboard."""
-        # Score colors
-        score_color = (255, 255, 255)  # White
-        
-        # Create score text surfaces
-        player1_text = self.score_font.render(str(self.player1_score), True, score_color)
-        player2_text = self.score_font.render(str(self.player2_score), True, score_color)
+    def _get_score_blits(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Get the (surface, rect) pairs that draw the scoreboard."""
+        # Get score text surfaces
+        player1_text = self._get_score_surface(self.player1_score)
+        player2_text = self._get_score_surface(self.player2_score)
         
         # Position scores on screen
         screen_center_x = self.config.SCREEN_WIDTH // 2
@@ -201,6 +344,13 @@ class RenderSystem(System):
         player2_rect.centerx = screen_center_x + score_offset
         player2_rect.centery = score_y
         
-        # Draw scores
-        self.screen.blit(player1_text, player1_rect)
-        self.screen.blit(player2_text, player2_rect) 
\ No newline at end of file
+        return [(player1_text, player1_rect), (player2_text, player2_rect)]
+    
+    def _get_score_surface(self, score: int) -> pygame.Surface:
+        """Get the rendered text for a score, rendering it on first use."""
+        surface = self._score_surfaces.get(score)
+        if surface is None:
+            score_color = (255, 255, 255)  # White
+            surface = self.score_font.render(str(score), True, score_color)
+            self._score_surfaces[score] = surface
+        return surface
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Tests for the hand-written command line parser.
+"""
+
+import argparse
+
+import pytest
+
+from ping_pong.__main__ import HELP, parse_args
+
+
+def _argparse_parser():
+    """The argparse definition the hand-written parser replaces."""
+    parser = argparse.ArgumentParser(prog="python -m ping_pong", description="Ping-Pong Game")
+    parser.add_argument("--config", type=str, default="config.json",
+                        help="Path to configuration file (default: config.json)")
+    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--windowed", action="store_true",
+                        help="Force windowed mode (disable fullscreen)")
+    parser.add_argument("--fps", type=int, default=60, help="Target FPS (default: 60)")
+    return parser
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["--debug"],
+    ["--windowed", "--debug"],
+    ["--config", "custom.json", "--fps", "120"],
+    ["--config=other.json", "--fps=30"],
+    ["--fps", "30", "--fps", "90"],
+    ["--fps", "-5"],
+])
+def test_valid_arguments_match_argparse(argv):
+    expected = _argparse_parser().parse_args(argv)
+    assert vars(parse_args(argv)) == vars(expected)
+
+
+@pytest.mark.parametrize("argv, message", [
+    (["--fps", "fast"], "argument --fps: invalid int value: 'fast'"),
+    (["--fps"], "argument --fps: expected one argument"),
+    (["--config", "--debug"], "argument --config: expected one argument"),
+    (["--debug=yes"], "argument --debug: ignored explicit argument 'yes'"),
+    (["--volume", "3"], "unrecognized arguments: --volume"),
+])
+def test_usage_errors_exit_with_status_2(argv, message, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        parse_args(argv)
+    assert exit_info.value.code == 2
+    assert f"ping_pong: error: {message}" in capsys.readouterr().err
+
+
+def test_help_exits_cleanly(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        parse_args(["-h"])
+    assert exit_info.value.code == 0
+    assert capsys.readouterr().out.strip() == HELP
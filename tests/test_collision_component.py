@@ -0,0 +1,35 @@
+"""
+Tests for the collision data CollisionComponent caches in the store.
+"""
+
+from ping_pong.components.collision import CollisionComponent, CollisionType
+from ping_pong.core.ecs.entity_manager import EntityManager
+
+
+def _stored_collision(**kwargs):
+    entity_manager = EntityManager()
+    entity = entity_manager.create_entity()
+    entity_manager.add_component(entity, CollisionComponent(**kwargs))
+    return entity_manager.store, entity, entity_manager.get_component(entity, CollisionComponent)
+
+
+def test_assigning_type_and_mask_updates_the_store():
+    store, entity, collision = _stored_collision(collision_type=CollisionType.BALL)
+    assert store.col_type[entity] == float(CollisionType.BALL)
+
+    collision.collision_type = CollisionType.WALL
+    collision.collision_mask = CollisionType.BALL | CollisionType.PADDLE
+    assert store.col_type[entity] == float(CollisionType.WALL)
+    assert store.col_mask[entity] == float(CollisionType.BALL | CollisionType.PADDLE)
+    assert collision.can_collide_with(CollisionType.BALL)
+    assert not collision.can_collide_with(CollisionType.GOAL)
+
+
+def test_assigning_size_updates_half_extents():
+    store, entity, collision = _stored_collision(width=10.0, height=20.0)
+    assert (store.col_half_w[entity], store.col_half_h[entity]) == (5.0, 10.0)
+
+    collision.width = 30.0
+    collision.height = 8.0
+    assert (store.col_half_w[entity], store.col_half_h[entity]) == (15.0, 4.0)
+    assert collision.get_collision_bounds(100.0, 50.0) == (85.0, 46.0, 115.0, 54.0)
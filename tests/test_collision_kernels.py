@@ -0,0 +1,56 @@
+"""
+Tests for the sweep-and-prune broad phase.
+"""
+
+import numpy as np
+import pytest
+
+from ping_pong.systems._collision_kernels import sweep_pairs
+
+
+def _brute_force_pairs(ids, pos_x, pos_y, half_w, half_h, type_bits, mask_bits):
+    pairs = set()
+    for i, a in enumerate(ids):
+        for b in ids[i + 1:]:
+            if not (int(mask_bits[a]) & int(type_bits[b]) and int(mask_bits[b]) & int(type_bits[a])):
+                continue
+            if (abs(pos_x[a] - pos_x[b]) < half_w[a] + half_w[b] and
+                    abs(pos_y[a] - pos_y[b]) < half_h[a] + half_h[b]):
+                pairs.add((a, b))
+    return pairs
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sweep_pairs_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    capacity = 200
+    pos_x = rng.uniform(0.0, 400.0, capacity).astype(np.float32)
+    pos_y = rng.uniform(0.0, 300.0, capacity).astype(np.float32)
+    half_w = rng.uniform(1.0, 20.0, capacity).astype(np.float32)
+    half_h = rng.uniform(1.0, 20.0, capacity).astype(np.float32)
+    type_bits = (1 << rng.integers(0, 3, capacity)).astype(np.float32)
+    mask_bits = rng.integers(1, 8, capacity).astype(np.float32)
+
+    # A shuffled subset, so IDs are neither contiguous nor sorted
+    ids = rng.permutation(capacity)[:150].astype(np.int64)
+    out_pairs = np.empty((len(ids) * len(ids), 2), dtype=np.int64)
+
+    count = sweep_pairs(ids, pos_x, pos_y, half_w, half_h, type_bits, mask_bits, out_pairs)
+
+    found = [tuple(pair) for pair in out_pairs[:count].tolist()]
+    assert len(found) == len(set(found))
+    expected = _brute_force_pairs(ids.tolist(), pos_x, pos_y, half_w, half_h,
+                                  type_bits, mask_bits)
+    assert set(found) == expected
+
+
+def test_sweep_pairs_counts_past_a_full_buffer():
+    pos_x = np.zeros(4, dtype=np.float32)
+    pos_y = np.zeros(4, dtype=np.float32)
+    half = np.ones(4, dtype=np.float32)
+    bits = np.ones(4, dtype=np.float32)
+    ids = np.arange(4, dtype=np.int64)
+    out_pairs = np.empty((2, 2), dtype=np.int64)
+
+    # All four boxes overlap: six pairs, only two of which fit
+    assert sweep_pairs(ids, pos_x, pos_y, half, half, bits, bits, out_pairs) == 6
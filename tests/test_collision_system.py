@@ -0,0 +1,44 @@
+"""
+Tests for CollisionSystem boundary handling.
+"""
+
+from ping_pong.components.collision import CollisionComponent, CollisionType
+from ping_pong.components.position import PositionComponent
+from ping_pong.components.velocity import VelocityComponent
+from ping_pong.core.config import GameConfig
+from ping_pong.core.ecs.entity_manager import EntityManager
+from ping_pong.systems.collision import CollisionSystem
+
+
+def _ball(entity_manager, y, velocity=None):
+    entity_id = entity_manager.create_entity()
+    entity_manager.add_component(entity_id, PositionComponent(400.0, y))
+    entity_manager.add_component(entity_id, CollisionComponent(collision_type=CollisionType.BALL))
+    if velocity is not None:
+        entity_manager.add_component(entity_id, velocity)
+    return entity_id
+
+
+def test_only_balls_with_a_velocity_bounce_off_walls():
+    entity_manager = EntityManager()
+    collision_system = CollisionSystem(entity_manager, GameConfig())
+    still = _ball(entity_manager, 2.0)
+    moving = _ball(entity_manager, 598.0, VelocityComponent(dx=50.0, dy=120.0))
+
+    collision_system.update(1 / 60, [still, moving])
+
+    store = entity_manager.store
+    velocity = entity_manager.get_component(moving, VelocityComponent)
+    assert (velocity.dx, velocity.dy) == (50.0, -120.0)
+    assert (store.vel_dx[still], store.vel_dy[still]) == (0.0, 0.0)
+    assert entity_manager.get_component(still, PositionComponent).y == 5.0
+
+
+def test_wall_hit_without_any_velocity_components():
+    entity_manager = EntityManager()
+    collision_system = CollisionSystem(entity_manager, GameConfig())
+    still = _ball(entity_manager, 599.0)
+
+    collision_system.update(1 / 60, [still])
+
+    assert entity_manager.get_component(still, PositionComponent).y == 595.0
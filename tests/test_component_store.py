@@ -0,0 +1,68 @@
+"""
+Tests for ComponentStore rows and the component views bound to them.
+"""
+
+import copy
+import dataclasses
+
+import numpy as np
+
+from ping_pong.components.position import PositionComponent
+from ping_pong.components.velocity import VelocityComponent
+from ping_pong.core.ecs.entity_manager import EntityManager
+
+
+def test_destroyed_entity_row_is_cleared_and_reused():
+    entity_manager = EntityManager()
+    store = entity_manager.store
+
+    first = entity_manager.create_entity()
+    second = entity_manager.create_entity()
+    entity_manager.add_component(first, PositionComponent(10.0, 20.0))
+    entity_manager.add_component(first, VelocityComponent(dx=3.0, dy=4.0))
+    entity_manager.add_component(second, PositionComponent(5.0, 6.0))
+
+    entity_manager.destroy_entity(first)
+    entity_manager.cleanup_destroyed_entities()
+
+    # The row is zeroed, and the surviving entity is untouched
+    assert store.mask[first] == 0
+    assert store.pos_x[first] == 0.0 and store.pos_y[first] == 0.0
+    assert store.vel_dx[first] == 0.0 and store.vel_dy[first] == 0.0
+    assert (store.pos_x[second], store.pos_y[second]) == (5.0, 6.0)
+
+    # The freed ID is handed out again and starts from a clean row
+    reused = entity_manager.create_entity()
+    assert reused == first
+    assert entity_manager.get_component(reused, PositionComponent) is None
+
+    entity_manager.add_component(reused, PositionComponent(7.0, 8.0))
+    position = entity_manager.get_component(reused, PositionComponent)
+    assert (position.x, position.y) == (7.0, 8.0)
+    assert store.mask[reused] == np.uint64(store.get_mask([PositionComponent]))
+    assert entity_manager.get_entities_with_components([VelocityComponent]) == []
+
+
+def test_views_behave_like_their_component_type():
+    entity_manager = EntityManager()
+    entity = entity_manager.create_entity()
+    entity_manager.add_component(entity, PositionComponent(1.5, 2.5))
+    view = entity_manager.get_component(entity, PositionComponent)
+
+    # Re-adding a fetched view files it under the component type
+    entity_manager.add_component(entity, view)
+    view = entity_manager.get_component(entity, PositionComponent)
+    assert view == PositionComponent(1.5, 2.5)
+    assert PositionComponent(1.5, 2.5) == view
+
+    # Copies own their values instead of sharing the store row
+    copied = copy.copy(view)
+    copied.x = 9.0
+    replaced = dataclasses.replace(view, y=7.0)
+    assert (view.x, view.y) == (1.5, 2.5)
+    assert (copied.x, replaced.y) == (9.0, 7.0)
+
+    # A removed component keeps its values while the row is zeroed
+    entity_manager.remove_component(entity, PositionComponent)
+    assert (view.x, view.y) == (1.5, 2.5)
+    assert entity_manager.store.pos_x[entity] == 0.0
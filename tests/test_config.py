@@ -0,0 +1,115 @@
+"""
+Tests for GameConfig loading, caching and snapshots.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from ping_pong.core.config import GameConfig
+
+
+def _write_config(path, settings, mtime_ns):
+    path.write_text(json.dumps(settings))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_is_cached_by_path_and_mtime(tmp_path):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, {"BALL_SPEED": 250.0}, 1_000_000_000)
+
+    first = GameConfig.load_from_file(str(config_path))
+    second = GameConfig.load_from_file(str(config_path))
+    assert first == second and first is not second
+
+    # Loaded configs are independent copies of the cached parse
+    first.BALL_SPEED = 1.0
+    assert GameConfig.load_from_file(str(config_path)).BALL_SPEED == 250.0
+
+    # A new modification time means the file is parsed again
+    _write_config(config_path, {"BALL_SPEED": 300.0}, 2_000_000_000)
+    assert GameConfig.load_from_file(str(config_path)).BALL_SPEED == 300.0
+
+
+def test_save_drops_the_cached_parse(tmp_path):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, {"WINNING_SCORE": 3}, 1_000_000_000)
+    assert GameConfig.load_from_file(str(config_path)).WINNING_SCORE == 3
+
+    config = GameConfig(WINNING_SCORE=7)
+    config.save_to_file(str(config_path))
+    os.utime(config_path, ns=(1_000_000_000, 1_000_000_000))
+    assert GameConfig.load_from_file(str(config_path)).WINNING_SCORE == 7
+
+
+def test_unreadable_config_falls_back_to_defaults(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.json"
+    real_stat = Path.stat
+
+    def denied_stat(self, *args, **kwargs):
+        if self == config_path:
+            raise PermissionError("denied")
+        return real_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", denied_stat)
+    assert GameConfig.load_from_file(str(config_path)) == GameConfig()
+
+
+def test_validate_settings_result_is_cached_until_a_setting_changes():
+    config = GameConfig()
+    assert config.validate_settings() == []
+
+    # Callers get a fresh list, so the cached result cannot be mutated
+    config.validate_settings().append("scribble")
+    assert config.validate_settings() == []
+
+    config.MAX_BALL_SPEED = 10.0
+    assert config.validate_settings() == ["Max ball speed must be >= initial ball speed"]
+
+    config.MAX_BALL_SPEED = 600.0
+    config.SFX_VOLUME = 2.0
+    assert config.validate_settings() == ["Volume values must be between 0.0 and 1.0"]
+
+
+def test_physics_snapshot_is_frozen_and_refreshed_on_change():
+    config = GameConfig()
+    physics = config.snapshot()
+    assert config.snapshot() is physics
+    assert (physics.screen_width, physics.max_ball_speed) == (800, 600.0)
+
+    with pytest.raises(AttributeError):
+        physics.max_ball_speed = 1.0
+
+    config.MAX_BALL_SPEED = 900.0
+    refreshed = config.snapshot()
+    assert refreshed is not physics
+    assert refreshed.max_ball_speed == 900.0
+    assert physics.max_ball_speed == 600.0
+
+
+def test_config_is_slotted():
+    config = GameConfig()
+    assert not hasattr(config, "__dict__")
+    with pytest.raises(AttributeError):
+        config.NOT_A_SETTING = 1
+
+
+def test_saved_settings_and_summary_follow_changes(tmp_path):
+    config = GameConfig()
+    summary = config.get_config_summary()
+    assert config.get_config_summary() is summary
+
+    config.WINNING_SCORE = 4
+    assert config.get_config_summary()["gameplay"]["winning_score"] == 4
+
+    config_path = tmp_path / "config.json"
+    config.save_to_file(str(config_path))
+    config.BALL_SPEED = 123.0
+    config.save_to_file(str(config_path))
+
+    saved = json.loads(config_path.read_text())
+    assert (saved["WINNING_SCORE"], saved["BALL_SPEED"]) == (4, 123.0)
+    # Internal cache fields are never written
+    assert not any(name.startswith("_") for name in saved)
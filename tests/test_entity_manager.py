@@ -0,0 +1,83 @@
+"""
+Tests for the EntityManager's maintained archetype lists.
+"""
+
+from ping_pong.components.position import PositionComponent
+from ping_pong.components.velocity import VelocityComponent
+from ping_pong.core.ecs.entity_manager import EntityManager
+from ping_pong.core.ecs.system import System
+from ping_pong.core.ecs.system_manager import SystemManager
+
+
+class _Reaper(System):
+    """System that destroys every entity it is given."""
+
+    REQUIRED_COMPONENTS = frozenset({PositionComponent})
+
+    def __init__(self, entity_manager):
+        super().__init__()
+        self.entity_manager = entity_manager
+        self.visited = []
+
+    def update(self, dt, entities):
+        for entity_id in entities:
+            self.visited.append(entity_id)
+            self.entity_manager.destroy_entity(entity_id)
+
+
+def _entities_with_position(entity_manager, count):
+    entities = []
+    for _ in range(count):
+        entity_id = entity_manager.create_entity()
+        entity_manager.add_component(entity_id, PositionComponent())
+        entities.append(entity_id)
+    return entities
+
+
+def test_system_can_destroy_entities_while_iterating():
+    entity_manager = EntityManager()
+    system_manager = SystemManager(entity_manager)
+    reaper = _Reaper(entity_manager)
+    system_manager.register_system(reaper)
+    entities = _entities_with_position(entity_manager, 6)
+
+    system_manager.update_all_systems(1 / 60)
+
+    assert sorted(reaper.visited) == entities
+    assert entity_manager.get_entity_count() == 0
+    assert entity_manager.get_entities_with_components([PositionComponent]) == []
+
+
+def test_returned_archetype_list_is_not_changed_later():
+    entity_manager = EntityManager()
+    archetype = [PositionComponent, VelocityComponent]
+    entity_manager.register_archetype(archetype)
+    first, second = _entities_with_position(entity_manager, 2)
+    entity_manager.add_component(first, VelocityComponent())
+
+    entities = entity_manager.get_entities_with_components(archetype)
+    entity_manager.add_component(second, VelocityComponent())
+    entity_manager.remove_component(first, VelocityComponent)
+
+    assert entities == [first]
+    assert entity_manager.get_entities_with_components(archetype) == [second]
+
+
+def test_archetype_registered_late_is_filled_from_the_store_masks():
+    entity_manager = EntityManager()
+    moving = _entities_with_position(entity_manager, 3)
+    for entity_id in moving:
+        entity_manager.add_component(entity_id, VelocityComponent())
+    _entities_with_position(entity_manager, 2)
+    entity_manager.destroy_entity(moving[1])
+
+    archetype = [PositionComponent, VelocityComponent]
+    entity_manager.register_archetype(archetype)
+    assert entity_manager.get_entities_with_components(archetype) == [moving[0], moving[2]]
+
+    # Later additions are matched by the same bitmask test
+    still = entity_manager.create_entity()
+    entity_manager.add_component(still, VelocityComponent())
+    assert still not in entity_manager.get_entities_with_components(archetype)
+    entity_manager.add_component(still, PositionComponent())
+    assert still in entity_manager.get_entities_with_components(archetype)
@@ -0,0 +1,67 @@
+"""
+Tests for the pressed-key bitmask used by InputSystem.
+"""
+
+from itertools import chain, combinations
+
+import pygame
+
+from ping_pong.components.input import InputComponent
+from ping_pong.components.velocity import VelocityComponent
+from ping_pong.core.ecs.entity_manager import EntityManager
+from ping_pong.systems.input import InputSystem
+
+
+class _Pressed:
+    """Stand-in for pygame.key.get_pressed() with the given keys held."""
+
+    def __init__(self, keys):
+        self.keys = set(keys)
+
+    def __getitem__(self, key_code):
+        return key_code in self.keys
+
+
+def _player(player_number):
+    input_comp = InputComponent()
+    input_comp.setup_default_bindings(player_number)
+    return input_comp
+
+
+def test_mask_update_matches_set_update():
+    by_mask = _player(2)
+    by_set = _player(2)
+    keys = sorted(by_mask.get_bound_keys())
+    by_mask.assign_key_bits({key_code: 1 << index for index, key_code in enumerate(keys)})
+
+    held_sets = chain.from_iterable(combinations(keys, size) for size in range(len(keys) + 1))
+    for held in held_sets:
+        by_mask.update_input_mask(sum(1 << keys.index(key_code) for key_code in held))
+        by_set.update_input_state(set(held))
+        assert by_mask.current_actions == by_set.current_actions
+        assert by_mask.previous_actions == by_set.previous_actions
+        assert by_mask.get_movement_vector() == by_set.get_movement_vector()
+
+
+def test_system_polls_bound_keys_including_arrows(monkeypatch):
+    entity_manager = EntityManager()
+    input_system = InputSystem(entity_manager)
+    players = []
+    for player_number in (1, 2):
+        entity_id = entity_manager.create_entity()
+        entity_manager.add_component(entity_id, _player(player_number))
+        entity_manager.add_component(entity_id, VelocityComponent(max_speed=1000.0))
+        players.append(entity_id)
+
+    held = _Pressed({pygame.K_w, pygame.K_DOWN, pygame.K_RIGHT})
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: held)
+    input_system.update(1 / 60, players)
+
+    first = entity_manager.get_component(players[0], InputComponent)
+    second = entity_manager.get_component(players[1], InputComponent)
+    assert first.current_actions == {"move_up"}
+    assert second.current_actions == {"move_down", "move_right"}
+    assert second.is_action_just_pressed("move_down")
+
+    velocity = entity_manager.get_component(players[1], VelocityComponent)
+    assert (velocity.dx, velocity.dy) == (300.0, 300.0)
@@ -0,0 +1,39 @@
+"""
+Tests for the movement kernel, compiled and as plain Python.
+"""
+
+import numpy as np
+import pytest
+
+from ping_pong.core.jit import NUMBA_AVAILABLE
+from ping_pong.systems._movement_kernels import integrate_positions
+
+
+def _random_arrays(count=64, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(-500.0, 500.0, count).astype(np.float32) for _ in range(4)]
+
+
+def test_integrate_positions_matches_numpy():
+    pos_x, pos_y, vel_dx, vel_dy = _random_arrays()
+    dt = 1 / 60
+    expected_x = pos_x + vel_dx * np.float32(dt)
+    expected_y = pos_y + vel_dy * np.float32(dt)
+
+    integrate_positions(pos_x, pos_y, vel_dx, vel_dy, dt)
+
+    np.testing.assert_allclose(pos_x, expected_x, rtol=1e-6, atol=1e-4)
+    np.testing.assert_allclose(pos_y, expected_y, rtol=1e-6, atol=1e-4)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba is not installed")
+def test_integrate_positions_compiled_matches_python():
+    compiled = _random_arrays(seed=1)
+    interpreted = [array.copy() for array in compiled]
+
+    for _ in range(120):
+        integrate_positions(*compiled, 1 / 60)
+        integrate_positions.py_func(*interpreted, 1 / 60)
+
+    for compiled_array, interpreted_array in zip(compiled, interpreted):
+        np.testing.assert_allclose(compiled_array, interpreted_array, rtol=1e-5, atol=1e-3)
@@ -0,0 +1,62 @@
+"""
+Tests for the array-backed ParticleSystem.
+"""
+
+import numpy as np
+
+from ping_pong.systems.particle import ParticleSystem
+
+
+def _emit(particles, count, lifetime):
+    return particles.emit(
+        np.zeros(count), np.zeros(count), np.full(count, 60.0), np.full(count, -30.0),
+        [(255, 255, 255)] * count, np.full(count, lifetime),
+    )
+
+
+def test_particles_move_and_expire():
+    particles = ParticleSystem(capacity=8)
+    slots = _emit(particles, 3, 0.5)
+    assert slots.tolist() == [0, 1, 2]
+    assert particles.count == 3
+
+    particles.update(0.25, ())
+    np.testing.assert_allclose(particles.xs[slots], 15.0)
+    np.testing.assert_allclose(particles.ys[slots], -7.5)
+    assert particles.count == 3
+
+    particles.update(0.25, ())
+    assert particles.count == 0
+    assert not particles.alive.any()
+
+
+def test_expired_slots_are_reused_lowest_first():
+    particles = ParticleSystem(capacity=4)
+    _emit(particles, 2, 0.1)
+    long_lived = _emit(particles, 1, 10.0)
+    particles.update(0.2, ())
+    assert particles.count == 1
+
+    reused = _emit(particles, 2, 1.0)
+    assert reused.tolist() == [0, 1]
+    assert particles.alive[long_lived].all()
+
+
+def test_emit_grows_past_capacity():
+    particles = ParticleSystem(capacity=2)
+    slots = _emit(particles, 5, 1.0)
+    assert particles.capacity >= 5
+    assert sorted(slots.tolist()) == [0, 1, 2, 3, 4]
+    assert particles.count == 5
+
+
+def test_burst_spreads_evenly_around_the_center():
+    particles = ParticleSystem()
+    slots = particles.burst(100.0, 50.0, count=8, speed=10.0)
+    assert len(slots) == 8
+    np.testing.assert_allclose(particles.xs[slots], 100.0)
+    np.testing.assert_allclose(np.hypot(particles.vxs[slots], particles.vys[slots]), 10.0, rtol=1e-6)
+    np.testing.assert_allclose(particles.vxs[slots].sum(), 0.0, atol=1e-4)
+
+    particles.clear()
+    assert particles.count == 0
@@ -0,0 +1,102 @@
+"""
+Tests for dirty-rect rendering and presentation.
+"""
+
+import random
+
+import pygame
+import pytest
+
+from ping_pong.core.game import Game
+from ping_pong.systems.render import RenderSystem
+
+
+@pytest.fixture
+def game(tmp_path):
+    random.seed(5)
+    game = Game(config_path=str(tmp_path / "config.json"))
+    game.initialize_game_entities()
+    return game
+
+
+def _frames(game, count, force_full=False):
+    render_system = game.render_system
+    frames = []
+    for frame in range(count):
+        if frame == 20:
+            game.player1_score = 4
+        if frame == 40:
+            render_system.set_background_color((10, 20, 30))
+        if force_full:
+            render_system.request_full_redraw()
+        game._update_game(1 / 60)
+        game._render_game()
+        frames.append(pygame.image.tobytes(game.screen, "RGB"))
+    return frames
+
+
+def test_dirty_frames_match_full_redraws(tmp_path):
+    random.seed(5)
+    dirty_game = Game(config_path=str(tmp_path / "dirty.json"))
+    dirty_game.initialize_game_entities()
+    dirty = _frames(dirty_game, 90)
+
+    random.seed(5)
+    full_game = Game(config_path=str(tmp_path / "full.json"))
+    full_game.initialize_game_entities()
+    full = _frames(full_game, 90, force_full=True)
+
+    mismatched = [frame for frame in range(len(dirty)) if dirty[frame] != full[frame]]
+    assert mismatched == []
+
+
+def test_merged_rects_are_disjoint_and_cover_the_input():
+    bounds = pygame.Rect(0, 0, 100, 100)
+    rects = [pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10), pygame.Rect(50, 50, 5, 5),
+             pygame.Rect(12, 0, 10, 7), pygame.Rect(95, 95, 20, 20), pygame.Rect(200, 0, 5, 5)]
+
+    merged = RenderSystem._merge_rects(rects, bounds)
+
+    for index, rect in enumerate(merged):
+        assert bounds.contains(rect)
+        assert rect.collidelist(merged[index + 1:]) == -1
+    for rect in rects:
+        clipped = rect.clip(bounds)
+        if clipped:
+            assert clipped.collidelist(merged) != -1
+            assert any(other.contains(clipped) for other in merged)
+
+
+def test_presentation_after_pause_and_expose(game, monkeypatch):
+    calls = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: calls.append("flip"))
+    monkeypatch.setattr(pygame.display, "update", lambda rects: calls.append("update"))
+
+    # First frame is a full redraw, then only the moving areas
+    game._update_game(1 / 60)
+    game._render_game()
+    game._update_game(1 / 60)
+    game._render_game()
+    assert calls == ["flip", "update"]
+
+    # Nothing is rendered while paused, so nothing is presented
+    game._toggle_pause()
+    calls.clear()
+    game._render_game()
+    game._render_game()
+    assert calls == []
+
+    # An expose while paused re-presents the whole window once
+    pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+    game._handle_events()
+    game._render_game()
+    game._render_game()
+    assert calls == ["flip"]
+
+    # Unpausing redraws the whole screen
+    game._toggle_pause()
+    calls.clear()
+    game._update_game(1 / 60)
+    assert game.render_system.dirty_rects is None
+    game._render_game()
+    assert calls == ["flip"]
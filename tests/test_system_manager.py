@@ -0,0 +1,115 @@
+"""
+Tests for SystemManager stage grouping and dependency warnings.
+"""
+
+from ping_pong.components.collision import CollisionComponent
+from ping_pong.components.position import PositionComponent
+from ping_pong.components.velocity import VelocityComponent
+from ping_pong.core.ecs.entity_manager import EntityManager
+from ping_pong.core.ecs.system import System
+from ping_pong.core.ecs.system_manager import SystemManager
+
+
+class _TestSystem(System):
+    """System that records the order it was updated in."""
+
+    def __init__(self, priority, log):
+        super().__init__()
+        self.priority = priority
+        self.log = log
+
+    def update(self, dt, entities):
+        self.log.append(type(self).__name__)
+
+
+class Steer(_TestSystem):
+    READS = frozenset({PositionComponent})
+    WRITES = frozenset({VelocityComponent})
+
+
+class Move(_TestSystem):
+    READS = frozenset({VelocityComponent})
+    WRITES = frozenset({PositionComponent})
+
+
+class Collide(_TestSystem):
+    READS = frozenset({PositionComponent, CollisionComponent})
+    WRITES = frozenset({VelocityComponent})
+
+
+class Draw(_TestSystem):
+    READS = frozenset({PositionComponent})
+    WRITES = frozenset()
+
+
+class Hud(_TestSystem):
+    READS = frozenset({CollisionComponent})
+    WRITES = frozenset()
+
+
+def _manager(*systems):
+    system_manager = SystemManager(EntityManager())
+    for system in systems:
+        system_manager.register_system(system)
+    return system_manager
+
+
+def test_stages_follow_priority_and_split_on_conflicts():
+    log = []
+    system_manager = _manager(Draw(100, log), Move(10, log), Hud(110, log),
+                              Steer(0, log), Collide(20, log))
+
+    assert system_manager.get_system_execution_order() == [
+        "Steer", "Move", "Collide", "Draw", "Hud"]
+    # Move reads what Steer writes and Collide writes what Move reads;
+    # the read-only systems touch nothing Collide writes
+    assert system_manager.get_execution_stages() == [
+        ["Steer"], ["Move"], ["Collide", "Draw", "Hud"]]
+
+    system_manager.update_all_systems(1 / 60)
+    assert log == ["Steer", "Move", "Collide", "Draw", "Hud"]
+
+
+def test_reprioritizing_rebuilds_stages():
+    log = []
+    system_manager = _manager(Steer(0, log), Draw(10, log), Move(20, log))
+    assert system_manager.get_execution_stages() == [["Steer", "Draw"], ["Move"]]
+
+    system_manager.set_system_priority(Draw, 30)
+    assert system_manager.get_execution_stages() == [["Steer"], ["Move"], ["Draw"]]
+
+
+def test_dependency_warnings_use_declared_access():
+    log = []
+    assert _manager(Draw(0, log), Hud(10, log)).validate_system_dependencies() == []
+
+    warnings = _manager(Steer(0, log), Collide(10, log), Move(20, log)).validate_system_dependencies()
+    assert any("VelocityComponent is modified by multiple systems: Steer, Collide" in w
+               for w in warnings)
+    assert any("VelocityComponent is modified by Steer, Collide and read by Move" in w
+               for w in warnings)
+    # Position is only read besides Move's write, so it is not a multi-writer conflict
+    assert not any("PositionComponent is modified by multiple systems" in w for w in warnings)
+
+
+class Dynamic(_TestSystem):
+    """System whose required components change at runtime."""
+
+    required = frozenset({VelocityComponent})
+
+    def get_required_components(self):
+        return self.required
+
+
+def test_invalidating_required_components_refreshes_access():
+    log = []
+    dynamic = Dynamic(10, log)
+    system_manager = _manager(Steer(0, log), dynamic)
+    assert system_manager.get_execution_stages() == [["Steer"], ["Dynamic"]]
+
+    dynamic.required = frozenset({CollisionComponent})
+    system_manager.invalidate_required_components(Dynamic)
+
+    assert dynamic.reads == dynamic.writes == frozenset({CollisionComponent})
+    assert system_manager.get_execution_stages() == [["Steer", "Dynamic"]]
+    assert system_manager.validate_system_dependencies() == []